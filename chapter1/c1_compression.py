@@ -1,5 +1,45 @@
 from sys import getsizeof
 from random import choice
+from typing import Union
+
+INVALID: int = 0xFF
+
+# 256-entry translation tables: ASCII letter -> 2 bit code and back
+ENCODE_TABLE: bytes = bytes(
+    {ord('A'): 0b00, ord('C'): 0b01, ord('G'): 0b10, ord('T'): 0b11,
+     ord('a'): 0b00, ord('c'): 0b01, ord('g'): 0b10, ord('t'): 0b11}.get(i, INVALID)
+    for i in range(256))
+DECODE_TABLE: bytes = bytes.maketrans(b'\x00\x01\x02\x03', b'ACGT')
+
+def pack_nucleotides(gene: Union[str, bytes]) -> bytes:
+    # Four nucleotides per byte, the first one in the two highest bits
+    raw: bytes = gene.encode('ascii', 'replace') if isinstance(gene, str) else bytes(gene)
+    codes: bytes = raw.translate(ENCODE_TABLE)
+    bad: int = codes.find(INVALID)
+    if bad != -1:
+        raise ValueError('Nucleotide invalid: {}'.format(chr(raw[bad])))
+
+    codes += bytes(-len(codes) % 4)
+    size: int = len(codes) // 4
+    packed: int = 0
+    # Every code is < 4, so the shifts below never carry into a neighbour byte
+    for offset, shift in enumerate((6, 4, 2, 0)):
+        packed |= int.from_bytes(codes[offset::4], 'big') << shift
+
+    return packed.to_bytes(size, 'big')
+
+def unpack_nucleotides(packed: bytes, length: int) -> str:
+    size: int = len(packed)
+    value: int = int.from_bytes(packed, 'big')
+    mask: int = int.from_bytes(b'\x03' * size, 'big')
+    codes: bytearray = bytearray(size * 4)
+
+    for offset, shift in enumerate((6, 4, 2, 0)):
+        codes[offset::4] = ((value >> shift) & mask).to_bytes(size, 'big')
+
+    del codes[length:]
+    return codes.translate(DECODE_TABLE).decode('ascii')
+
 
 class GeneCompression:
     def __init__(self, gene: str) -> None:
@@ -8,41 +48,21 @@ class GeneCompression:
     def __str__(self) -> str:
         return self.decompress()
 
+    def __len__(self) -> int:
+        return self._length
+
     def _compress(self, gene: str) -> None:
-        self.bit_string: int = 1 # define a sentinel
-
-        for nucleotide in gene.upper():
-            self.bit_string <<= 2 # move 2 bits to the left
-
-            if nucleotide == 'A':
-                self.bit_string |= 0b00
-            elif nucleotide == 'C':
-                self.bit_string |= 0b01
-            elif nucleotide == 'G':
-                self.bit_string |= 0b10
-            elif nucleotide == 'T':
-                self.bit_string |= 0b11
-            else:
-                raise ValueError('Nucleotide invalid: {}'.format(nucleotide))
-        
+        self._length: int = len(gene)
+        self.packed: bytes = pack_nucleotides(gene)
+
+    @property
+    def bit_string(self) -> int:
+        # Compatibility view: sentinel 1 followed by 2 bits per nucleotide
+        padding: int = 2 * (-self._length % 4)
+        return (1 << (2 * self._length)) | (int.from_bytes(self.packed, 'big') >> padding)
+
     def decompress(self) -> str:
-        gene: str = ''
-
-        for i in range(0, self.bit_string.bit_length() - 1, 2):
-            bits: int = self.bit_string >> i & 0b11
-
-            if bits == 0b00:
-                gene += 'A'
-            elif bits == 0b01:
-                gene += 'C'
-            elif bits == 0b10:
-                gene += 'G'
-            elif bits == 0b11:
-                gene += 'T'
-            else:
-                raise ValueError('Invalid Bits: {}'.format(bits))
-        
-        return gene[::-1]
+        return unpack_nucleotides(self.packed, self._length)
 
 if __name__ == "__main__":
     sequence: str = ''.join([choice(['A', 'C', 'G', 'T']) for i in range(0, 100)])
@@ -50,6 +70,6 @@ if __name__ == "__main__":
     print('-' * 50)
     print('Original Size: {}'.format(getsizeof(sequence)))
     compressed_seq: GeneCompression = GeneCompression(sequence)
-    print('Compacted Size: {}'.format(getsizeof(compressed_seq.bit_string)))
+    print('Compacted Size: {}'.format(getsizeof(compressed_seq.packed)))
     print(compressed_seq)
     print('Validation: {}'.format(sequence == compressed_seq.decompress()))
@@ -1,5 +1,8 @@
 from secrets import token_bytes
-from typing import Tuple
+from typing import Tuple, BinaryIO
+from io import BytesIO
+
+CHUNK_SIZE: int = 1 << 20
 
 def random_key(length: int) -> int:
     tp: bytes = token_bytes(length)
@@ -20,8 +23,67 @@ def decrypt(key1: int, key2: int) -> str:
 
     return origin_key.decode()
 
+def xor_chunk(data: memoryview, key: memoryview) -> bytes:
+    # Fixed length output, so leading zero bytes are kept
+    size: int = len(data)
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(key, 'big')).to_bytes(size, 'big')
+
+def encrypt_stream(source: BinaryIO,
+                   output: BinaryIO,
+                   pad: BinaryIO,
+                   chunk_size: int = CHUNK_SIZE) -> int:
+    buffer: bytearray = bytearray(chunk_size)
+    view: memoryview = memoryview(buffer)
+    total: int = 0
+
+    while True:
+        size: int = source.readinto(buffer)
+        if not size:
+            return total
+        key: bytes = token_bytes(size)
+        pad.write(key)
+        output.write(xor_chunk(view[:size], memoryview(key)))
+        total += size
+
+def decrypt_stream(encrypted: BinaryIO,
+                   pad: BinaryIO,
+                   output: BinaryIO,
+                   chunk_size: int = CHUNK_SIZE) -> int:
+    buffer: bytearray = bytearray(chunk_size)
+    key_buffer: bytearray = bytearray(chunk_size)
+    view: memoryview = memoryview(buffer)
+    key_view: memoryview = memoryview(key_buffer)
+    total: int = 0
+
+    while True:
+        size: int = encrypted.readinto(buffer)
+        if not size:
+            return total
+        key_size: int = pad.readinto(key_view[:size])
+        if key_size != size:
+            raise ValueError('Pad is shorter than the encrypted data: {} bytes'.format(total + key_size))
+        output.write(xor_chunk(view[:size], key_view[:size]))
+        total += size
+
+def encrypt_file(path: str, output_path: str, pad_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    with open(path, 'rb') as source, open(output_path, 'wb') as output, open(pad_path, 'wb') as pad:
+        return encrypt_stream(source, output, pad, chunk_size)
+
+def decrypt_file(path: str, pad_path: str, output_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    with open(path, 'rb') as encrypted, open(pad_path, 'rb') as pad, open(output_path, 'wb') as output:
+        return decrypt_stream(encrypted, pad, output, chunk_size)
+
 
 if __name__ == "__main__":
     key1, key2 = encrypt('My Life!')
     result: str = decrypt(key1, key2)
-    print(result)
\ No newline at end of file
+    print(result)
+
+    message: bytes = b'\x00\x00My Life!'
+    encrypted, pad = BytesIO(), BytesIO()
+    encrypt_stream(BytesIO(message), encrypted, pad, chunk_size=4)
+    encrypted.seek(0)
+    pad.seek(0)
+    decrypted: BytesIO = BytesIO()
+    decrypt_stream(encrypted, pad, decrypted, chunk_size=4)
+    print(decrypted.getvalue() == message)
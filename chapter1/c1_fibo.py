@@ -1,5 +1,7 @@
-from typing import Dict
-from functools import lru_cache
+from typing import Dict, Tuple, Iterable, Optional, List
+from threading import local
+from time import perf_counter
+from c1_memo import Memo, memoize, MISSING
 
 # --------------- FIBO with Recusive Method ---------------
 def fibo1(x: int) -> int:
@@ -9,15 +11,27 @@ def fibo1(x: int) -> int:
     return fibo1(x - 2) + fibo1(x - 1) # Recursiviness
 
 # --------------- FIBO with Recusive and Memoization ---------------
-memo: Dict[int, int] = {0: 0, 1: 1} # Memoization
+memo: Memo[int, int] = Memo(maxsize=4096, pinned={0: 0, 1: 1}) # Bounded Memoization
+_filling: local = local()
 def fibo2(x: int) -> int:
-    if x not in memo:
-        memo[x] = fibo2(x -2) + fibo2(x - 1)
+    # One lookup: another thread may evict x between a membership test and a read
+    value: int = memo.get(x, MISSING)
+    if value is not MISSING:
+        return value
+    # A miss fills the memo upwards, like memoize(iterative=True), so deep x never recurse deeply
+    if not getattr(_filling, 'active', False):
+        _filling.active = True
+        try:
+            return memo.fill(fibo2, x)
+        finally:
+            _filling.active = False
 
-    return memo[x]
+    value = fibo2(x -2) + fibo2(x - 1)
+    memo[x] = value
+    return value
 
 # --------------- FIBO with Recusive and Auto Memoization ---------------
-@lru_cache(maxsize=None) # Auto Memoization
+@memoize(maxsize=4096, iterative=True) # Auto Memoization, bounded and without deep recursion
 def fibo3(x: int) -> int:
     if x < 2:
         return x
@@ -48,6 +62,85 @@ def fibo5(x: int) -> int:
         last, next = next, last + next
         yield next
 
+# --------------- Fibo with Fast Doubling: O(log n) multiplications ---------------
+# F(2k) = F(k) * (2 * F(k + 1) - F(k))
+# F(2k + 1) = F(k) ^ 2 + F(k + 1) ^ 2
+def _double(pair: Tuple[int, int], bit: int, m: Optional[int]) -> Tuple[int, int]:
+    a, b = pair
+    c: int = a * (2 * b - a)
+    d: int = a * a + b * b
+    if bit:
+        c, d = d, c + d
+    if m is not None:
+        c, d = c % m, d % m
+
+    return c, d
+
+def fibo_pair(x: int, m: Optional[int] = None) -> Tuple[int, int]:
+    # (F(x), F(x + 1)), optionally mod m
+    pair: Tuple[int, int] = (0, 1 % m if m is not None else 1)
+    for bit in bin(x)[2:]:
+        pair = _double(pair, bit == '1', m)
+
+    return pair
+
+def fibo6(x: int) -> int:
+    if x < 0:
+        raise ValueError('Negative index: {}'.format(x))
+
+    return fibo_pair(x)[0]
+
+def fibo_mod(x: int, m: int) -> int:
+    if x < 0:
+        raise ValueError('Negative index: {}'.format(x))
+    if m < 1:
+        raise ValueError('Invalid modulus: {}'.format(m))
+
+    # Every doubling works on values below m, so no Pisano period reduction is needed
+    return fibo_pair(x, m)[0]
+
+def fibo_batch(indexes: Iterable[int], m: Optional[int] = None) -> Dict[int, int]:
+    # Indexes sharing leading bits share the doublings computed for that prefix
+    indexes = list(indexes) # read twice below, iterators included
+    pairs: Dict[int, Tuple[int, int]] = {0: (0, 1 % m if m is not None else 1)}
+
+    for x in sorted(set(indexes)):
+        if x < 0:
+            raise ValueError('Negative index: {}'.format(x))
+
+        prefixes: List[int] = []
+        prefix: int = x
+        while prefix not in pairs:
+            prefixes.append(prefix)
+            prefix >>= 1
+        for prefix in reversed(prefixes):
+            pairs[prefix] = _double(pairs[prefix >> 1], prefix & 1, m)
+
+    return {x: pairs[x][0] for x in indexes}
+
+def benchmark(x: int = 25, repeat: int = 3) -> Dict[str, float]:
+    variants = {
+        'fibo1': fibo1,
+        'fibo2': fibo2,
+        'fibo3': fibo3,
+        'fibo4': fibo4,
+        'fibo5': lambda n: list(fibo5(n))[-1],
+        'fibo6': fibo6,
+    }
+    results: Dict[str, float] = {}
+
+    for name, function in variants.items():
+        best: float = float('inf')
+        for _ in range(repeat):
+            fibo3.cache_clear()
+            memo.clear()
+            start: float = perf_counter()
+            function(x)
+            best = min(best, perf_counter() - start)
+        results[name] = best
+
+    return results
+
 
 if __name__ == "__main__":
     print(fibo1(30))
@@ -56,4 +149,14 @@ if __name__ == "__main__":
     print(fibo4(30))
 
     for _ in fibo5(50):
-        print(_)
\ No newline at end of file
+        print(_)
+
+    print(fibo3(5000) == fibo6(5000))
+    print(memo.fill(fibo2, 5000) == fibo6(5000))
+    print(memo)
+    print(fibo6(30))
+    print(fibo_mod(10 ** 100, 1_000_000_007))
+    print(fibo_batch([10, 11, 20, 21, 40]))
+
+    for name, seconds in benchmark().items():
+        print(f'{name}: {seconds * 1000:.3f} ms')
\ No newline at end of file
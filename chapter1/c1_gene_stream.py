@@ -0,0 +1,131 @@
+"""
+Packed gene file:
+- 4 bytes magic: b'GENE'
+- 8 bytes big endian: number of nucleotides
+- 2 bits per nucleotide, four per byte, the first one in the highest bits
+"""
+from __future__ import annotations
+from typing import Iterable, Iterator, Union, BinaryIO
+from mmap import mmap, ACCESS_READ
+from random import choice
+from c1_compression import pack_nucleotides, unpack_nucleotides
+
+MAGIC: bytes = b'GENE'
+HEADER_SIZE: int = len(MAGIC) + 8
+CHUNK_SIZE: int = 1 << 20
+WHITESPACE: bytes = b' \t\r\n'
+
+def read_chunks(source: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while True:
+        chunk: bytes = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def compress_stream(chunks: Iterable[Union[str, bytes]], path: str) -> int:
+    length: int = 0
+    pending: bytes = b''
+
+    with open(path, 'wb') as output:
+        output.write(MAGIC + bytes(8))
+
+        for chunk in chunks:
+            raw: bytes = chunk.encode('ascii', 'replace') if isinstance(chunk, str) else chunk
+            pending += raw.translate(None, WHITESPACE)
+            # Only whole bytes (4 nucleotides) are written, the rest waits for the next chunk
+            usable: int = len(pending) - len(pending) % 4
+            output.write(pack_nucleotides(pending[:usable]))
+            length += usable
+            pending = pending[usable:]
+
+        output.write(pack_nucleotides(pending))
+        length += len(pending)
+        output.seek(len(MAGIC))
+        output.write(length.to_bytes(8, 'big'))
+
+    return length
+
+def compress_file(source_path: str, path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    with open(source_path, 'rb') as source:
+        return compress_stream(read_chunks(source, chunk_size), path)
+
+
+class GeneFile:
+    def __init__(self, path: str) -> None:
+        self._file: BinaryIO = open(path, 'rb')
+        try:
+            self._data: mmap = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError('Empty gene file: {}'.format(path))
+
+        if self._data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError('Invalid gene file: {}'.format(path))
+        self._length: int = int.from_bytes(self._data[len(MAGIC):HEADER_SIZE], 'big')
+
+    def __enter__(self) -> GeneFile:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return self._window(start, stop)
+            if step > 0:
+                return self._window(start, stop)[::step] if start < stop else ''
+            return self._window(stop + 1, start + 1)[::step] if stop < start else ''
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Gene index out of range: {}'.format(index))
+
+        byte: int = self._data[HEADER_SIZE + index // 4]
+        return 'ACGT'[(byte >> (6 - 2 * (index % 4))) & 0b11]
+
+    def __iter__(self) -> Iterator[str]:
+        for block in self.blocks():
+            yield from block
+
+    def __str__(self) -> str:
+        return self._window(0, self._length)
+
+    def _window(self, start: int, stop: int) -> str:
+        if start >= stop:
+            return ''
+        first: int = start // 4
+        last: int = (stop + 3) // 4
+        packed: bytes = self._data[HEADER_SIZE + first:HEADER_SIZE + last]
+
+        return unpack_nucleotides(packed, stop - first * 4)[start - first * 4:]
+
+    def blocks(self, block_size: int = CHUNK_SIZE) -> Iterator[str]:
+        block_size = max(block_size - block_size % 4, 4)
+        for start in range(0, self._length, block_size):
+            yield self._window(start, min(start + block_size, self._length))
+
+    def close(self) -> None:
+        if not self._data.closed:
+            self._data.close()
+        self._file.close()
+
+
+if __name__ == "__main__":
+    pieces = [''.join([choice(['A', 'C', 'G', 'T']) for i in range(0, 37)]) for _ in range(5)]
+    sequence: str = ''.join(pieces)
+    print(sequence)
+    print('-' * 50)
+    compress_stream(pieces, 'gene.bin')
+
+    with GeneFile('gene.bin') as gene:
+        print('Length: {}'.format(len(gene)))
+        print('gene[42]: {}'.format(gene[42]))
+        print('gene[10:30]: {}'.format(gene[10:30]))
+        print('Validation: {}'.format(sequence == ''.join(gene) and sequence[5:150:7] == gene[5:150:7]))
@@ -9,7 +9,7 @@ Rules:
 Solution:
 - Put the 3 Discs on the third Tower
 """
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Tuple, Iterator, Dict
 
 T = TypeVar('T')
 
@@ -21,7 +21,7 @@ class Stack(Generic[T]):
         self._container.append(item)
     
     def pop(self) -> T:
-        self._container.pop()
+        return self._container.pop()
     
     def __repr__(self) -> str:
         return repr(self._container)
@@ -36,6 +36,55 @@ def move_discs(begin: Stack[int], end: Stack[int], tmp: Stack[int], n: int) -> N
         move_discs(tmp, end, begin, n - 1)
     print(tower_a, tower_b, tower_c)
 
+# Discs are numbered as above: 1 is the biggest, n the smallest
+Move = Tuple[int, str, str]
+
+def hanoi_moves(n: int, begin: str = 'A', end: str = 'C', tmp: str = 'B') -> Iterator[Move]:
+    # Same order as move_discs, with an explicit stack of at most 2n frames
+    pending: List[Tuple[int, str, str, str]] = [(n, begin, end, tmp)]
+
+    while pending:
+        discs, source, target, spare = pending.pop()
+        if discs == 0:
+            continue
+        if discs < 0: # the biggest disc of a -discs subproblem
+            yield (n + discs + 1, source, target)
+            continue
+        pending.append((discs - 1, spare, target, source))
+        pending.append((-discs, source, target, spare))
+        pending.append((discs - 1, source, spare, target))
+
+def kth_move(n: int, k: int, begin: str = 'A', end: str = 'C', tmp: str = 'B') -> Move:
+    # k-th move (1 based) of hanoi_moves without simulating the previous ones
+    if not 1 <= k < (1 << n):
+        raise ValueError('Move out of range: {}'.format(k))
+
+    smallest_first: int = (k & -k).bit_length() # trailing zeros + 1
+    towers: Tuple[str, str, str] = (begin, end, tmp) if n % 2 == 0 else (begin, tmp, end)
+    source: int = (k & (k - 1)) % 3
+    target: int = ((k | (k - 1)) + 1) % 3
+
+    return (n - smallest_first + 1, towers[source], towers[target])
+
+def state_after(n: int, k: int, begin: str = 'A', end: str = 'C', tmp: str = 'B') -> Dict[str, List[int]]:
+    # Towers (bottom to top) after the first k moves, one step per disc
+    if not 0 <= k < (1 << n):
+        raise ValueError('Move out of range: {}'.format(k))
+
+    towers: Dict[str, List[int]] = {begin: [], tmp: [], end: []}
+    source, target, spare = begin, end, tmp
+    for disc in range(1, n + 1):
+        half: int = 1 << (n - disc)
+        if k < half:
+            towers[source].append(disc)
+            target, spare = spare, target
+        else:
+            towers[target].append(disc)
+            k -= half
+            source, spare = spare, source
+
+    return towers
+
 if __name__ == "__main__":
     num_discs: int = 3
     tower_a: Stack[int] = Stack()
@@ -49,4 +98,9 @@ if __name__ == "__main__":
 
     move_discs(tower_a, tower_c, tower_b, num_discs)
 
+    for move in hanoi_moves(num_discs):
+        print(move)
+    print(kth_move(40, 2 ** 39))
+    print(state_after(40, 123456789012))
+
     
@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Dict, Optional, Callable, Any
+from collections import OrderedDict
+from functools import wraps
+from threading import RLock, local
+from sys import getsizeof
+
+K = TypeVar('K')
+V = TypeVar('V')
+MISSING: Any = object()
+
+
+class Memo(Generic[K, V]):
+    # LRU memo bounded by number of entries and/or bytes; pinned entries are never evicted
+    def __init__(self,
+                 maxsize: Optional[int] = 1024,
+                 max_bytes: Optional[int] = None,
+                 pinned: Optional[Dict[K, V]] = None) -> None:
+        self.maxsize: Optional[int] = maxsize
+        self.max_bytes: Optional[int] = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._pinned: Dict[K, V] = dict(pinned or {})
+        self._container: OrderedDict = OrderedDict()
+        self._bytes: int = 0
+        self._lock: RLock = RLock()
+
+    def __repr__(self) -> str:
+        return 'Memo(size={}, bytes={}, hits={}, misses={}, evictions={})'\
+            .format(len(self), self._bytes, self.hits, self.misses, self.evictions)
+
+    def __len__(self) -> int:
+        return len(self._container) + len(self._pinned)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            found: bool = key in self._pinned or key in self._container
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return found
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            if key in self._pinned:
+                return self._pinned[key]
+            self._container.move_to_end(key)
+            return self._container[key]
+
+    def get(self, key: K, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._pinned:
+                self.hits += 1
+                return self._pinned[key]
+            if key in self._container:
+                self.hits += 1
+                self._container.move_to_end(key)
+                return self._container[key]
+            self.misses += 1
+            return default
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            if key in self._pinned:
+                return
+            if key in self._container:
+                self._bytes -= self._entry_size(key, self._container.pop(key))
+            self._container[key] = value
+            self._bytes += self._entry_size(key, value)
+            self._evict()
+
+    @staticmethod
+    def _entry_size(key: K, value: V) -> int:
+        return getsizeof(key) + getsizeof(value)
+
+    def _evict(self) -> None:
+        while self._container and \
+                ((self.maxsize is not None and len(self._container) > self.maxsize) or
+                 (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            key, value = self._container.popitem(last=False)
+            self._bytes -= self._entry_size(key, value)
+            self.evictions += 1
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self), 'bytes': self._bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._container.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def fill(self, function: Callable[[int], V], x: int) -> V:
+        # Iterative path for recursions on smaller ints: start from the nearest
+        # cached index below x and go up, so each call only recurses one level.
+        # The lock is held so other threads cannot evict the entries being chained
+        with self._lock:
+            start: int = x
+            while start > 0 and start not in self._pinned and start not in self._container:
+                start -= 1
+            for i in range(start, x):
+                function(i)
+
+            return function(x)
+
+
+def memoize(maxsize: Optional[int] = 1024,
+            max_bytes: Optional[int] = None,
+            iterative: bool = False) -> Callable[[Callable[[int], V]], Callable[[int], V]]:
+    def decorator(function: Callable[[int], V]) -> Callable[[int], V]:
+        memo: Memo[int, V] = Memo(maxsize, max_bytes)
+        filling: local = local()
+
+        @wraps(function)
+        def wrapper(x: int) -> Any:
+            value: Any = memo.get(x, MISSING)
+            if value is not MISSING:
+                return value
+            if iterative and not getattr(filling, 'active', False):
+                filling.active = True
+                try:
+                    return memo.fill(wrapper, x)
+                finally:
+                    filling.active = False
+
+            value = function(x)
+            memo[x] = value
+            return value
+
+        wrapper.memo = memo
+        wrapper.cache_clear = memo.clear
+        return wrapper
+    return decorator
@@ -1,3 +1,9 @@
+from typing import Tuple, List, Dict
+from math import fsum, isqrt, log10, pi as math_pi
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from os import cpu_count
+import sys
 
 def calc_pi(n_terms: int) -> float:
     numerator: float = 4.0
@@ -9,8 +15,116 @@ def calc_pi(n_terms: int) -> float:
         pi += operator * (numerator / denominator)
         denominator += 2.0
         operator *= -1.0
-    
+
     return pi
 
+# --------------- Leibniz terms k in [start, stop) ---------------
+def leibniz_range(start: int, stop: int) -> float:
+    # Positive and negative terms are summed apart: no sign per term and fsum keeps it exact
+    first_even: int = start + start % 2
+    first_odd: int = start + 1 - start % 2
+    positive: float = fsum([4.0 / (2 * k + 1) for k in range(first_even, stop, 2)])
+    negative: float = fsum([4.0 / (2 * k + 1) for k in range(first_odd, stop, 2)])
+
+    return positive - negative
+
+def calc_pi_chunked(n_terms: int, chunk_size: int = 1 << 16) -> float:
+    return fsum([leibniz_range(start, min(start + chunk_size, n_terms))
+                 for start in range(0, n_terms, chunk_size)])
+
+def calc_pi_parallel(n_terms: int, workers: int = cpu_count() or 1) -> float:
+    if n_terms <= 0:
+        return 0.0
+    step: int = -(-n_terms // workers)
+    bounds: List[Tuple[int, int]] = [(start, min(start + step, n_terms)) for start in range(0, n_terms, step)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return fsum(executor.map(leibniz_range, *zip(*bounds)))
+
+# --------------- Euler transform: repeated averages of the partial sums ---------------
+def calc_pi_euler(n_terms: int) -> float:
+    if n_terms <= 0:
+        return 0.0
+    sums: List[float] = []
+    total: float = 0.0
+    for k in range(n_terms):
+        total += (4.0 if k % 2 == 0 else -4.0) / (2 * k + 1)
+        sums.append(total)
+
+    while len(sums) > 1:
+        sums = [(a + b) / 2.0 for a, b in zip(sums, sums[1:])]
+
+    return sums[0]
+
+# --------------- Chudnovsky with binary splitting ---------------
+def _split(a: int, b: int) -> Tuple[int, int, int]:
+    if b - a == 1:
+        p: int = 1
+        q: int = 1
+        if a > 0:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * 10939058860032000 # 640320^3 / 24
+        t: int = p * (13591409 + 545140134 * a)
+        return p, q, -t if a % 2 else t
+
+    middle: int = (a + b) // 2
+    p1, q1, t1 = _split(a, middle)
+    p2, q2, t2 = _split(middle, b)
+
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+def chudnovsky(digits: int) -> str:
+    # Each term adds about 14.18 digits
+    terms: int = digits // 14 + 2
+    _, q, t = _split(0, terms)
+    one: int = 10 ** (digits + 10)
+    sqrt_c: int = isqrt(10005 * one * one)
+    value: int = 426880 * sqrt_c * q // t
+
+    # Python >= 3.11 limits int -> str conversions to 4300 digits by default
+    limit: int = sys.get_int_max_str_digits() if hasattr(sys, 'get_int_max_str_digits') else 0
+    if limit:
+        sys.set_int_max_str_digits(0)
+    try:
+        pi: str = str(value)[:digits + 1]
+    finally:
+        if limit:
+            sys.set_int_max_str_digits(limit)
+
+    return pi[0] + '.' + pi[1:]
+
+def _correct_digits(value: float) -> float:
+    error: float = abs(value - math_pi)
+    return 16.0 if error == 0 else max(0.0, -log10(error))
+
+def benchmark(n_terms: int = 1_000_000, digits: int = 10_000) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    series = {
+        'calc_pi': (calc_pi, n_terms),
+        'calc_pi_chunked': (calc_pi_chunked, n_terms),
+        'calc_pi_parallel': (calc_pi_parallel, n_terms),
+        'calc_pi_euler': (calc_pi_euler, 40),
+    }
+
+    for name, (function, terms) in series.items():
+        start: float = perf_counter()
+        value: float = function(terms)
+        elapsed: float = perf_counter() - start
+        results[name] = {'terms': terms, 'seconds': elapsed, 'terms/sec': terms / elapsed,
+                         'digits/sec': _correct_digits(value) / elapsed}
+
+    start = perf_counter()
+    chudnovsky(digits)
+    elapsed = perf_counter() - start
+    results['chudnovsky'] = {'terms': digits // 14 + 2, 'seconds': elapsed,
+                             'terms/sec': (digits // 14 + 2) / elapsed, 'digits/sec': digits / elapsed}
+
+    return results
+
 if __name__ == "__main__":
-    print(calc_pi(4000))
\ No newline at end of file
+    print(calc_pi(4000))
+    print(calc_pi_euler(40))
+    print(chudnovsky(50))
+
+    for name, result in benchmark().items():
+        print(f"{name}: {result['terms/sec']:,.0f} terms/sec | {result['digits/sec']:,.1f} digits/sec")
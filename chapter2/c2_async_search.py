@@ -0,0 +1,149 @@
+"""
+Cooperative versions of dfs/bfs/astar for asyncio servers: they give the loop
+a turn every yield_every expansions, stop at a time budget and can be
+cancelled like any other task.
+"""
+from __future__ import annotations
+from typing import TypeVar, List, Callable, Optional, Dict, Any
+import asyncio
+import random
+from c2_generic_search import Node, Stack, Queue, PriorityQueue, SearchStats, node_to_path
+
+T = TypeVar('T')
+YIELD_EVERY: int = 500
+
+
+class SearchTimeout(asyncio.TimeoutError):
+    # best: the frontier node closest to the goal (lowest heuristic) when time ran out
+    def __init__(self, best: Optional[Node], frontier_size: int) -> None:
+        super().__init__('Search budget exhausted with {} nodes on the frontier'.format(frontier_size))
+        self.best: Optional[Node] = best
+        self.frontier_size: int = frontier_size
+
+
+def _best_partial(nodes: List[Node[T]], heuristic: Optional[Callable[[T], float]]) -> Optional[Node[T]]:
+    if not nodes:
+        return None
+    if heuristic is None:
+        return max(nodes, key=lambda node: node.cost)
+    return min(nodes, key=lambda node: (heuristic(node.state), node.cost))
+
+async def _search(initial: T,
+                  goal_test: Callable[[T], bool],
+                  successors: Callable[[T], List[T]],
+                  frontier: Any,
+                  heuristic: Optional[Callable[[T], float]],
+                  yield_every: int,
+                  budget: Optional[float],
+                  return_partial: bool,
+                  stats: Optional[SearchStats]) -> Optional[Node[T]]:
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    deadline: Optional[float] = None if budget is None else loop.time() + budget
+    weighted: bool = isinstance(frontier, PriorityQueue)
+    h: Callable[[T], float] = heuristic if heuristic is not None else (lambda state: 0.0)
+
+    frontier.push(Node(initial, None, 0.0, h(initial)))
+    explored: Dict[T, float] = {initial: 0.0}
+    expanded: int = 0
+
+    while not frontier.empty:
+        expanded += 1
+        if expanded % yield_every == 0:
+            await asyncio.sleep(0) # CancelledError is raised here
+            if deadline is not None and loop.time() >= deadline:
+                best: Optional[Node[T]] = _best_partial(list(frontier), heuristic)
+                if return_partial:
+                    return best
+                raise SearchTimeout(best, len(frontier))
+
+        current_node: Node[T] = frontier.pop()
+        current_state: T = current_node.state
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(explored))
+
+        if goal_test(current_state):
+            return current_node
+
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
+            new_cost: float = current_node.cost + 1
+            # dfs/bfs only visit a state once, astar again when the path got cheaper
+            if child in explored and (not weighted or explored[child] <= new_cost):
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            explored[child] = new_cost
+            frontier.push(Node(child, current_node, new_cost, h(child) if weighted else 0.0))
+
+    return None
+
+async def async_dfs(initial: T,
+                    goal_test: Callable[[T], bool],
+                    successors: Callable[[T], List[T]],
+                    yield_every: int = YIELD_EVERY,
+                    budget: Optional[float] = None,
+                    heuristic: Optional[Callable[[T], float]] = None,
+                    return_partial: bool = False,
+                    stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    return await _search(initial, goal_test, successors, Stack(), heuristic,
+                         yield_every, budget, return_partial, stats)
+
+async def async_bfs(initial: T,
+                    goal_test: Callable[[T], bool],
+                    successors: Callable[[T], List[T]],
+                    yield_every: int = YIELD_EVERY,
+                    budget: Optional[float] = None,
+                    heuristic: Optional[Callable[[T], float]] = None,
+                    return_partial: bool = False,
+                    stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    return await _search(initial, goal_test, successors, Queue(), heuristic,
+                         yield_every, budget, return_partial, stats)
+
+async def async_astar(initial: T,
+                      goal_test: Callable[[T], bool],
+                      successors: Callable[[T], List[T]],
+                      heuristic: Callable[[T], float],
+                      yield_every: int = YIELD_EVERY,
+                      budget: Optional[float] = None,
+                      return_partial: bool = False,
+                      stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    return await _search(initial, goal_test, successors, PriorityQueue(), heuristic,
+                         yield_every, budget, return_partial, stats)
+
+
+if __name__ == "__main__":
+    from c2_maze_solution import Maze, MazeLocation, manhattan_distance
+
+    async def heartbeat(ticks: List[int]) -> None:
+        while True:
+            ticks[0] += 1
+            await asyncio.sleep(0.01)
+
+    async def main() -> None:
+        random.seed(5)
+        m: Maze = Maze(400, 400, 0.2, goal=MazeLocation(399, 399))
+        ticks: List[int] = [0]
+        beat: asyncio.Task = asyncio.create_task(heartbeat(ticks))
+
+        solution = await async_astar(m.start, m.goal_test, m.successors, manhattan_distance(m.goal))
+        print('A*: {} steps, heartbeat ran {} times meanwhile'.format(
+            len(node_to_path(solution)) if solution else None, ticks[0]))
+
+        try:
+            await async_bfs(m.start, m.goal_test, m.successors, budget=0.05,
+                            heuristic=manhattan_distance(m.goal))
+        except SearchTimeout as timeout:
+            print('BFS timed out, best partial: {}'.format(timeout.best.state if timeout.best else None))
+
+        task: asyncio.Task = asyncio.create_task(async_dfs(m.start, lambda ml: False, m.successors))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            print('DFS cancelled')
+        beat.cancel()
+
+    asyncio.run(main())
@@ -0,0 +1,213 @@
+"""
+Benchmarks of the chapter 2 searches on seeded workloads.
+
+Every (workload, algorithm) pair reports wall time (best of repeat runs),
+nodes expanded, tracemalloc peak and path length. Results are saved as JSON
+and compared with a stored baseline:
+    python c2_benchmark.py --output results.json --baseline baseline.json
+    python c2_benchmark.py --binary-search
+New variants are added with @algorithm('name', kinds).
+"""
+from typing import List, Callable, Optional, Dict, Any, NamedTuple, Tuple, Sequence
+from time import perf_counter
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+from bisect import bisect_left
+from c2_generic_search import dfs, bfs, astar, bidirectional_bfs, SearchStats, Node, node_to_path
+from c2_generic_search import binary_search, batch_binary_search
+from c2_maze_solution import Maze, MazeLocation, manhattan_distance
+from c2_missionaries_and_cannibals import MCProblem, MCState
+from c2_jump_point_search import jps
+
+MAZE_SIZES: Tuple[int, ...] = (20, 60, 150)
+SPARSENESS: Tuple[float, ...] = (0.1, 0.2, 0.3)
+MC_PROBLEMS: Tuple[Tuple[int, int, int], ...] = ((3, 3, 2), (5, 5, 3), (100, 100, 4), (1000, 1000, 10))
+TOLERANCE: float = 0.25 # slower than baseline by more than this fraction is a regression
+MIN_SECONDS: float = 0.005 # shorter runs are too noisy to compare times
+
+
+class Workload(NamedTuple):
+    name: str
+    kind: str # 'maze' or 'mc'
+    problem: Any
+    initial: Any
+    goal: Any
+    goal_test: Callable[[Any], bool]
+    successors: Callable[[Any], List[Any]]
+    heuristic: Callable[[Any], float]
+
+
+Search = Callable[[Workload, SearchStats], Optional[List[Any]]]
+ALGORITHMS: Dict[str, Tuple[Search, Tuple[str, ...]]] = {}
+
+def algorithm(name: str, kinds: Tuple[str, ...] = ('maze', 'mc')) -> Callable[[Search], Search]:
+    def register(search: Search) -> Search:
+        ALGORITHMS[name] = (search, kinds)
+        return search
+    return register
+
+def _path(solution: Optional[Node]) -> Optional[List[Any]]:
+    return node_to_path(solution) if solution is not None else None
+
+@algorithm('dfs')
+def _dfs(w: Workload, stats: SearchStats) -> Optional[List[Any]]:
+    return _path(dfs(w.initial, w.goal_test, w.successors, stats=stats))
+
+@algorithm('bfs')
+def _bfs(w: Workload, stats: SearchStats) -> Optional[List[Any]]:
+    return _path(bfs(w.initial, w.goal_test, w.successors, stats=stats))
+
+@algorithm('astar')
+def _astar(w: Workload, stats: SearchStats) -> Optional[List[Any]]:
+    return _path(astar(w.initial, w.goal_test, w.successors, w.heuristic, stats=stats))
+
+@algorithm('astar-indexed')
+def _astar_indexed(w: Workload, stats: SearchStats) -> Optional[List[Any]]:
+    return _path(astar(w.initial, w.goal_test, w.successors, w.heuristic, stats=stats, indexed=True))
+
+@algorithm('bidirectional_bfs')
+def _bidirectional_bfs(w: Workload, stats: SearchStats) -> Optional[List[Any]]:
+    # Both problems have reversible moves: predecessors are the successors
+    return _path(bidirectional_bfs(w.initial, w.goal, w.successors, w.successors, stats=stats))
+
+@algorithm('jps', ('maze', ))
+def _jps(w: Workload, stats: SearchStats) -> Optional[List[Any]]:
+    return jps(w.problem, stats)
+
+
+def maze_workloads(sizes: Sequence[int] = MAZE_SIZES,
+                   sparseness: Sequence[float] = SPARSENESS,
+                   seed: int = 42) -> List[Workload]:
+    workloads: List[Workload] = []
+    for size in sizes:
+        for blocked in sparseness:
+            random.seed(seed)
+            goal: MazeLocation = MazeLocation(size - 1, size - 1)
+            maze: Maze = Maze(size, size, blocked, goal=goal)
+            workloads.append(Workload('maze-{}x{}-{}'.format(size, size, blocked), 'maze', maze,
+                                      maze.start, goal, maze.goal_test, maze.successors,
+                                      manhattan_distance(goal)))
+    return workloads
+
+def mc_workloads(problems: Sequence[Tuple[int, int, int]] = MC_PROBLEMS) -> List[Workload]:
+    workloads: List[Workload] = []
+    for missionaries, cannibals, capacity in problems:
+        problem: MCProblem = MCProblem(missionaries, cannibals, capacity)
+        # Every crossing carries at most capacity people
+        heuristic: Callable[[MCState], float] = lambda state, c=capacity: (state.wm + state.wc) / c
+        workloads.append(Workload('mc-{}-{}-{}'.format(missionaries, cannibals, capacity), 'mc', problem,
+                                  problem.start, problem.state(0, 0, False), MCState.goal_test,
+                                  MCState.successors, heuristic))
+    return workloads
+
+def measure(workload: Workload, name: str, repeat: int = 3) -> Dict[str, Any]:
+    search: Search = ALGORITHMS[name][0]
+    seconds: float = float('inf')
+    for _ in range(repeat):
+        stats: SearchStats = SearchStats()
+        start: float = perf_counter()
+        path: Optional[List[Any]] = search(workload, stats)
+        seconds = min(seconds, perf_counter() - start)
+
+    # Separate run: tracemalloc slows every allocation down
+    tracemalloc.start()
+    try:
+        search(workload, SearchStats())
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'workload': workload.name, 'algorithm': name, 'seconds': seconds, 'expanded': stats.expanded,
+            'peak_bytes': peak, 'path_length': len(path) if path is not None else None}
+
+def run_benchmarks(workloads: Sequence[Workload],
+                   algorithms: Optional[Sequence[str]] = None,
+                   repeat: int = 3) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for workload in workloads:
+        for name in (algorithms or ALGORITHMS):
+            if workload.kind in ALGORITHMS[name][1]:
+                results.append(measure(workload, name, repeat))
+    return results
+
+def compare(results: List[Dict[str, Any]],
+            baseline: List[Dict[str, Any]],
+            tolerance: float = TOLERANCE) -> List[str]:
+    # Slower runs, more expansions or a different path length than the baseline
+    previous: Dict[Tuple[str, str], Dict[str, Any]] = {(b['workload'], b['algorithm']): b for b in baseline}
+    problems: List[str] = []
+    for result in results:
+        base: Optional[Dict[str, Any]] = previous.get((result['workload'], result['algorithm']))
+        if base is None:
+            continue
+        label: str = '{} {}'.format(result['algorithm'], result['workload'])
+        if result['path_length'] != base['path_length']:
+            problems.append('{}: path length {} -> {}'.format(label, base['path_length'], result['path_length']))
+        if result['expanded'] > base['expanded']:
+            problems.append('{}: expanded {} -> {}'.format(label, base['expanded'], result['expanded']))
+        if result['seconds'] > max(base['seconds'] * (1 + tolerance), MIN_SECONDS):
+            problems.append('{}: {:.4f}s -> {:.4f}s'.format(label, base['seconds'], result['seconds']))
+    return problems
+
+def benchmark_binary_search(size: int = 1_000_000,
+                            queries: int = 100_000,
+                            seed: int = 42) -> Dict[str, float]:
+    # Seconds to answer the same membership queries with every variant
+    random.seed(seed)
+    sequence: List[int] = sorted(random.sample(range(size * 4), size))
+    terms: List[int] = [random.randrange(size * 4) for _ in range(queries)]
+
+    variants: Dict[str, Callable[[], List[bool]]] = {
+        'binary_search': lambda: [binary_search(sequence, term) for term in terms],
+        'bisect': lambda: [(i < size and sequence[i] == term)
+                           for i, term in ((bisect_left(sequence, term), term) for term in terms)],
+        'batch_binary_search': lambda: batch_binary_search(sequence, terms),
+    }
+    results: Dict[str, float] = {}
+    expected: Optional[List[bool]] = None
+    for name, run in variants.items():
+        start: float = perf_counter()
+        found: List[bool] = run()
+        results[name] = perf_counter() - start
+        if expected is not None and found != expected:
+            raise AssertionError('{} disagrees with binary_search'.format(name))
+        expected = found
+
+    return results
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON file of an earlier run to compare with')
+    parser.add_argument('--algorithms', nargs='+', choices=sorted(ALGORITHMS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--quick', action='store_true', help='smallest workloads only')
+    parser.add_argument('--binary-search', action='store_true',
+                        help='time binary_search, bisect and batch_binary_search instead')
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.binary_search:
+        print(json.dumps(benchmark_binary_search(), indent=2))
+        sys.exit(0)
+
+    workloads: List[Workload] = maze_workloads(MAZE_SIZES[:1]) + mc_workloads(MC_PROBLEMS[:2]) if args.quick \
+        else maze_workloads() + mc_workloads()
+    results: List[Dict[str, Any]] = run_benchmarks(workloads, args.algorithms, args.repeat)
+    text: str = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as source:
+            regressions: List[str] = compare(results, json.load(source), args.tolerance)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
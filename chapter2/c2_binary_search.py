@@ -6,8 +6,10 @@ gene: a sequence of codons
 """
 
 from enum import IntEnum
-from typing import Tuple, List
+from typing import Tuple, List, Union
+from bisect import bisect_left
 from random import choice
+from c2_linear_search import CodedGene, codon_to_code, str_to_codes
 
 Nucleotide: IntEnum = IntEnum('Nucleotide', ('A', 'C', 'G', 'T'))
 Codon = Tuple[Nucleotide, Nucleotide, Nucleotide]
@@ -40,6 +42,16 @@ def binary_search(gene: Gene, search_term: Codon) -> bool:
             return True
     return False
 
+def sort_codes(codes: CodedGene) -> bytes:
+    # Counting sort: there are only 64 different codes
+    return b''.join([bytes([code]) * codes.count(code) for code in range(64)])
+
+def binary_search_codes(codes: CodedGene, search_term: Union[Codon, int]) -> bool:
+    # codes must be sorted (sort_codes)
+    code: int = search_term if isinstance(search_term, int) else codon_to_code(search_term)
+    index: int = bisect_left(codes, code)
+    return index < len(codes) and codes[index] == code
+
 
 if __name__ == "__main__":
     gene_str = ''.join([choice(['A', 'C', 'G', 'T']) for i in range(0,64)])
@@ -54,3 +66,6 @@ if __name__ == "__main__":
     print(binary_search(my_gene, gat))
 
     print(acg in my_gene) # Every class implemented __contains__ can do this
+
+    my_codes: bytes = sort_codes(str_to_codes(gene_str))
+    print(binary_search_codes(my_codes, acg), binary_search_codes(my_codes, gat))
@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import TypeVar, Iterable, Sequence, Generic, List
-from typing import Callable, Set, Deque, Dict, Any, Optional
+from typing import TypeVar, Iterable, Iterator, Sequence, Generic, List
+from typing import Callable, Set, Deque, Dict, Any, Optional, Tuple
 from typing_extensions import Protocol
 from heapq import heappush, heappop
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from functools import wraps
+from inspect import signature
+from time import perf_counter
 
 T = TypeVar('T')
 C = TypeVar('C', bound='Comparable')
@@ -14,6 +19,12 @@ class Stack(Generic[T]):
     
     def __repr__(self) -> str:
         return repr(self._container)
+
+    def __len__(self) -> int:
+        return len(self._container)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._container)
     
     @property
     def empty(self) -> bool:
@@ -41,6 +52,101 @@ class Node(Generic[T]):
         return (self.cost + self.heuristic) < (other.cost + other.heuristic)
 
 
+class SearchTree(Generic[T]):
+    # Compact bookkeeping: every state is kept once, as a key of the parents
+    # dict; costs are only stored for astar (dfs/bfs paths carry no cost)
+    def __init__(self, weighted: bool = False) -> None:
+        self.parents: Dict[T, Optional[T]] = {}
+        self.costs: Optional[Dict[T, float]] = {} if weighted else None
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def __contains__(self, state: T) -> bool:
+        return state in self.parents
+
+    def add(self, state: T, parent: Optional[T] = None, cost: float = 0.0) -> None:
+        self.parents[state] = parent
+        if self.costs is not None:
+            self.costs[state] = cost
+
+    def node(self, state: T) -> CompactNode[T]:
+        return CompactNode(self, state)
+
+    def path(self, state: Optional[T]) -> List[T]:
+        path: List[T] = []
+        while state is not None:
+            path.append(state)
+            state = self.parents[state]
+        path.reverse()
+
+        return path
+
+
+class CompactNode(Generic[T]):
+    # Node-like view over a SearchTree entry, built only for the result
+    __slots__ = ('tree', 'state')
+
+    def __init__(self, tree: SearchTree[T], state: T) -> None:
+        self.tree: SearchTree[T] = tree
+        self.state: T = state
+
+    @property
+    def parent(self) -> Optional[CompactNode[T]]:
+        parent: Optional[T] = self.tree.parents[self.state]
+        return None if parent is None else CompactNode(self.tree, parent)
+
+    @property
+    def cost(self) -> float:
+        return self.tree.costs[self.state] if self.tree.costs is not None else 0.0
+
+
+class SearchStats:
+    # Work done by a search; on_expand(state) is called every sample_every expansions
+    def __init__(self,
+                 on_expand: Optional[Callable[[Any], None]] = None,
+                 sample_every: int = 1) -> None:
+        self.on_expand: Optional[Callable[[Any], None]] = on_expand
+        self.sample_every: int = sample_every
+        self.expanded: int = 0
+        self.generated: int = 0
+        self.duplicates: int = 0
+        self.peak_frontier: int = 0
+        self.peak_explored: int = 0
+        self.elapsed: float = 0.0
+        self.phases: Dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return ('SearchStats(expanded={}, generated={}, duplicates={}, peak_frontier={}, '
+                'peak_explored={}, elapsed={:.6f})')\
+            .format(self.expanded, self.generated, self.duplicates, self.peak_frontier,
+                    self.peak_explored, self.elapsed)
+
+    def expand(self, state: Any, frontier: int, explored: int) -> None:
+        self.expanded += 1
+        if frontier > self.peak_frontier:
+            self.peak_frontier = frontier
+        if explored > self.peak_explored:
+            self.peak_explored = explored
+        if self.on_expand is not None and self.expanded % self.sample_every == 0:
+            self.on_expand(state)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start: float = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed: float = perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            self.elapsed += elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'expanded': self.expanded, 'generated': self.generated, 'duplicates': self.duplicates,
+                'peak_frontier': self.peak_frontier, 'peak_explored': self.peak_explored,
+                'elapsed': self.elapsed, 'phases': dict(self.phases)}
+
+
 class Comparable(Protocol):
     def __eq__(self, other: Any) -> bool:
         ...
@@ -65,6 +171,12 @@ class Queue(Generic[T]):
     
     def __repr__(self) -> str:
         return repr(self._container)
+
+    def __len__(self) -> int:
+        return len(self._container)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._container)
     
     @property
     def empty(self) -> bool:
@@ -84,6 +196,12 @@ class PriorityQueue(Generic[T]):
     def __repr__(self) -> str:
         return repr(self._container)
 
+    def __len__(self) -> int:
+        return len(self._container)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._container)
+
     @property
     def empty(self) -> bool:
         return not self._container
@@ -95,6 +213,172 @@ class PriorityQueue(Generic[T]):
         return heappop(self._container)
 
 
+class IndexedPriorityQueue(Generic[T]):
+    # Binary heap of keys with a position index: decrease_key instead of duplicate entries
+    def __init__(self) -> None:
+        self._keys: List[T] = []
+        self._priorities: List[Any] = []
+        self._positions: Dict[T, int] = {}
+
+    def __repr__(self) -> str:
+        return repr(list(zip(self._keys, self._priorities)))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: T) -> bool:
+        return key in self._positions
+
+    @property
+    def empty(self) -> bool:
+        return not self._keys
+
+    def contains(self, key: T) -> bool:
+        return key in self._positions
+
+    def priority(self, key: T) -> Any:
+        return self._priorities[self._positions[key]]
+
+    def push(self, key: T, priority: Any) -> None:
+        # Insert, or change the priority of a key already queued
+        if key in self._positions:
+            position: int = self._positions[key]
+            old: Any = self._priorities[position]
+            self._priorities[position] = priority
+            if priority < old:
+                self._sift_up(position)
+            else:
+                self._sift_down(position)
+            return
+        self._keys.append(key)
+        self._priorities.append(priority)
+        self._positions[key] = len(self._keys) - 1
+        self._sift_up(len(self._keys) - 1)
+
+    def decrease_key(self, key: T, priority: Any) -> None:
+        position: int = self._positions[key]
+        if self._priorities[position] < priority:
+            raise ValueError('New priority is bigger: {} > {}'.format(priority, self._priorities[position]))
+        self._priorities[position] = priority
+        self._sift_up(position)
+
+    def peek(self) -> Tuple[T, Any]:
+        return self._keys[0], self._priorities[0]
+
+    def pop(self) -> Tuple[T, Any]:
+        key: T = self._keys[0]
+        priority: Any = self._priorities[0]
+        last_key: T = self._keys.pop()
+        last_priority: Any = self._priorities.pop()
+        del self._positions[key]
+        if self._keys:
+            self._keys[0] = last_key
+            self._priorities[0] = last_priority
+            self._positions[last_key] = 0
+            self._sift_down(0)
+        return key, priority
+
+    def _sift_up(self, position: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        key: T = keys[position]
+        priority: Any = priorities[position]
+        while position > 0:
+            parent: int = (position - 1) // 2
+            if not priority < priorities[parent]:
+                break
+            keys[position] = keys[parent]
+            priorities[position] = priorities[parent]
+            positions[keys[position]] = position
+            position = parent
+        keys[position] = key
+        priorities[position] = priority
+        positions[key] = position
+
+    def _sift_down(self, position: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        size: int = len(keys)
+        key: T = keys[position]
+        priority: Any = priorities[position]
+        while True:
+            child: int = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            keys[position] = keys[child]
+            priorities[position] = priorities[child]
+            positions[keys[position]] = position
+            position = child
+        keys[position] = key
+        priorities[position] = priority
+        positions[key] = position
+
+
+class RadixHeap(Generic[T]):
+    # Monotone queue for integer priorities (each pop >= the previous one), as in
+    # Dijkstra with integer weights; same interface as IndexedPriorityQueue
+    def __init__(self) -> None:
+        self._buckets: List[Dict[T, int]] = [{}]
+        self._bucket_of: Dict[T, int] = {}
+        self._last: int = 0
+
+    def __repr__(self) -> str:
+        return repr(self._buckets)
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
+
+    def __contains__(self, key: T) -> bool:
+        return key in self._bucket_of
+
+    @property
+    def empty(self) -> bool:
+        return not self._bucket_of
+
+    def contains(self, key: T) -> bool:
+        return key in self._bucket_of
+
+    def priority(self, key: T) -> int:
+        return self._buckets[self._bucket_of[key]][key]
+
+    def _place(self, key: T, priority: int) -> None:
+        index: int = (priority ^ self._last).bit_length()
+        while len(self._buckets) <= index:
+            self._buckets.append({})
+        self._buckets[index][key] = priority
+        self._bucket_of[key] = index
+
+    def push(self, key: T, priority: int) -> None:
+        if priority < self._last:
+            raise ValueError('Priority lower than the last popped one: {} < {}'.format(priority, self._last))
+        if key in self._bucket_of:
+            del self._buckets[self._bucket_of[key]][key]
+        self._place(key, priority)
+
+    def decrease_key(self, key: T, priority: int) -> None:
+        if self.priority(key) < priority:
+            raise ValueError('New priority is bigger: {} > {}'.format(priority, self.priority(key)))
+        self.push(key, priority)
+
+    def pop(self) -> Tuple[T, int]:
+        if not self._buckets[0]:
+            index: int = 1
+            while not self._buckets[index]:
+                index += 1
+            bucket: Dict[T, int] = self._buckets[index]
+            self._buckets[index] = {}
+            self._last = min(bucket.values())
+            for key, priority in bucket.items():
+                self._place(key, priority)
+        bucket = self._buckets[0]
+        key: T = next(iter(bucket))
+        priority = bucket.pop(key)
+        del self._bucket_of[key]
+        return key, priority
+
+
 def linear_search(iterable: Iterable[T], search_term: T) -> bool:
     for item in iterable:
         if item == search_term:
@@ -116,9 +400,54 @@ def binary_search(sequence: Sequence[C], search_term: C) -> bool:
             return True
     return False
 
+def _batch_bisect(sequence: Sequence[C],
+                  search_terms: Sequence[C],
+                  bisect: Callable[..., int]) -> List[int]:
+    # Merged sweep: the terms are visited in sorted order, so every answer is
+    # a lower limit for the next bisection
+    order: List[int] = sorted(range(len(search_terms)), key=search_terms.__getitem__)
+    indexes: List[int] = [0] * len(search_terms)
+    low: int = 0
+    for i in order:
+        low = bisect(sequence, search_terms[i], low)
+        indexes[i] = low
+    return indexes
+
+def batch_lower_bound(sequence: Sequence[C], search_terms: Sequence[C]) -> List[int]:
+    # For every term, the first index whose item is not less than it (bisect_left)
+    return _batch_bisect(sequence, search_terms, bisect_left)
+
+def batch_upper_bound(sequence: Sequence[C], search_terms: Sequence[C]) -> List[int]:
+    # For every term, the first index whose item is greater than it (bisect_right)
+    return _batch_bisect(sequence, search_terms, bisect_right)
+
+def batch_binary_search(sequence: Sequence[C], search_terms: Sequence[C]) -> List[bool]:
+    size: int = len(sequence)
+    return [index < size and sequence[index] == term
+            for index, term in zip(batch_lower_bound(sequence, search_terms), search_terms)]
+
+
+def _timed(function: Callable[..., Any]) -> Callable[..., Any]:
+    # Times the whole call when a SearchStats is given, otherwise calls straight through
+    position: int = list(signature(function).parameters).index('stats')
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats: Optional[SearchStats] = kwargs.get('stats', args[position] if len(args) > position else None)
+        if stats is None:
+            return function(*args, **kwargs)
+        with stats.phase('search'):
+            return function(*args, **kwargs)
+    return wrapper
+
+@_timed
 def dfs(initial: T,
         goal_test: Callable[[T], bool],
-        successors: Callable[[T], List[T]]) -> Optional[Node[T]]:
+        successors: Callable[[T], List[T]],
+        compact: bool = False,
+        stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    if compact:
+        return _compact_search(initial, goal_test, successors, Stack(), stats)
     
     # Places that are not visited by the algorithm
     frontier: Stack[Node[T]] = Stack()
@@ -131,22 +460,34 @@ def dfs(initial: T,
     while not frontier.empty:
         current_node: Node[T] = frontier.pop()
         current_state: T = current_node.state
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(explored))
 
         # Success
         if goal_test(current_state):
             return current_node
         
         # Where to go next
-        for child in successors(current_state):
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
             if child in explored:
+                if stats is not None:
+                    stats.duplicates += 1
                 continue
             explored.add(child)
             frontier.push(Node(child, current_node))
     return None
 
+@_timed
 def bfs(initial: T,
         goal_test: Callable[[T], bool],
-        successors: Callable[[T], List[T]]) -> Optional[Node[T]]:
+        successors: Callable[[T], List[T]],
+        compact: bool = False,
+        stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    if compact:
+        return _compact_search(initial, goal_test, successors, Queue(), stats)
     
     frontier: Queue[Node[T]] = Queue()
     frontier.push(Node(initial, None))
@@ -156,22 +497,37 @@ def bfs(initial: T,
     while not frontier.empty:
         current_node: Node[T] = frontier.pop()
         current_state: T = current_node.state
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(explored))
 
         if goal_test(current_state):
             return current_node
         
-        for child in successors(current_state):
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
             if child in explored:
+                if stats is not None:
+                    stats.duplicates += 1
                 continue
             explored.add(child)
             frontier.push(Node(child, current_node))
     
     return None
 
+@_timed
 def astar(initial: T,
           goal_test: Callable[[T], bool],
           successors: Callable[[T], List[T]],
-          heuristic: Callable[[T], float]) -> Optional[Node[T]]:
+          heuristic: Callable[[T], float],
+          compact: bool = False,
+          stats: Optional[SearchStats] = None,
+          indexed: bool = False) -> Optional[Node[T]]:
+    if compact:
+        return _compact_astar(initial, goal_test, successors, heuristic, stats)
+    if indexed:
+        return _indexed_astar(initial, goal_test, successors, heuristic, stats)
     
     frontier: PriorityQueue[Node[T]] = PriorityQueue()
     frontier.push(Node(initial, None, 0.0, heuristic(initial)))
@@ -181,22 +537,344 @@ def astar(initial: T,
     while not frontier.empty:
         current_node: Node[T] = frontier.pop()
         current_state: T = current_node.state
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(explored))
 
         if goal_test(current_state):
             return current_node
         
-        for child in successors(current_state):
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
             new_cost: float = current_node.cost + 1
 
             if child not in explored or explored[child] > new_cost:
                 explored[child] = new_cost
                 frontier.push(Node(child, current_node, new_cost, heuristic(child)))
+            elif stats is not None:
+                stats.duplicates += 1
             
     return None
 
+def _indexed_astar(initial: T,
+                   goal_test: Callable[[T], bool],
+                   successors: Callable[[T], List[T]],
+                   heuristic: Callable[[T], float],
+                   stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    # One queue entry per state: improvements lower its priority in place.
+    # Priorities are (f, h) so ties on f go to the lower h
+    nodes: Dict[T, Node[T]] = {initial: Node(initial, None, 0.0, heuristic(initial))}
+    frontier: IndexedPriorityQueue[T] = IndexedPriorityQueue()
+    frontier.push(initial, (nodes[initial].heuristic, nodes[initial].heuristic))
+
+    while not frontier.empty:
+        current_state: T = frontier.pop()[0]
+        current_node: Node[T] = nodes[current_state]
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(nodes))
+
+        if goal_test(current_state):
+            return current_node
+
+        new_cost: float = current_node.cost + 1
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
+            known: Optional[Node[T]] = nodes.get(child)
+            if known is not None and known.cost <= new_cost:
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            h: float = known.heuristic if known is not None else heuristic(child)
+            nodes[child] = Node(child, current_node, new_cost, h)
+            frontier.push(child, (new_cost + h, h))
+
+    return None
+
+def _compact_search(initial: T,
+                    goal_test: Callable[[T], bool],
+                    successors: Callable[[T], List[T]],
+                    frontier: Any,
+                    stats: Optional[SearchStats] = None) -> Optional[CompactNode[T]]:
+    # dfs/bfs with a Stack/Queue of states and a parent dict instead of Nodes
+    tree: SearchTree[T] = SearchTree()
+    tree.add(initial)
+    frontier.push(initial)
+
+    while not frontier.empty:
+        current_state: T = frontier.pop()
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(tree))
+
+        if goal_test(current_state):
+            return tree.node(current_state)
+
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
+            if child in tree.parents:
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            tree.add(child, current_state)
+            frontier.push(child)
+
+    return None
+
+def _compact_astar(initial: T,
+                   goal_test: Callable[[T], bool],
+                   successors: Callable[[T], List[T]],
+                   heuristic: Callable[[T], float],
+                   stats: Optional[SearchStats] = None) -> Optional[CompactNode[T]]:
+    tree: SearchTree[T] = SearchTree(weighted=True)
+    costs: Dict[T, float] = tree.costs
+    tree.add(initial)
+    # (f, h, push order, state): ties go to the lower h, then the older entry,
+    # so states are never compared
+    h: float = heuristic(initial)
+    frontier: List[Tuple[float, float, int, T]] = [(h, h, 0, initial)]
+    pushed: int = 1
+
+    while frontier:
+        current_f, current_h, _, current_state = heappop(frontier)
+        if current_f > costs[current_state] + current_h:
+            continue # stale entry, a cheaper path was pushed later
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(tree))
+
+        if goal_test(current_state):
+            return tree.node(current_state)
+
+        new_cost: float = costs[current_state] + 1
+        children: List[T] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child in children:
+            if child in costs and costs[child] <= new_cost:
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            tree.add(child, current_state, new_cost)
+            h = heuristic(child)
+            heappush(frontier, (new_cost + h, h, pushed, child))
+            pushed += 1
+
+    return None
+
+@_timed
+def weighted_astar(initial: T,
+                   goal_test: Callable[[T], bool],
+                   successors: Callable[[T], List[Tuple[T, float]]],
+                   heuristic: Callable[[T], float],
+                   stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    # successors gives (state, step cost); ties on f go to the lower h
+    frontier: PriorityQueue[Tuple[float, float, Node[T]]] = PriorityQueue()
+    h: float = heuristic(initial)
+    frontier.push((h, h, Node(initial, None, 0.0, h)))
+
+    best: Dict[T, float] = {initial: 0.0}
+    closed: Set[T] = set()
+
+    while not frontier.empty:
+        current_node: Node[T] = frontier.pop()[2]
+        current_state: T = current_node.state
+
+        # Stale entry: a cheaper path to this state was pushed later
+        if current_state in closed or current_node.cost > best[current_state]:
+            continue
+        closed.add(current_state)
+        if stats is not None:
+            stats.expand(current_state, len(frontier), len(best))
+
+        if goal_test(current_state):
+            return current_node
+
+        children: List[Tuple[T, float]] = successors(current_state)
+        if stats is not None:
+            stats.generated += len(children)
+        for child, step_cost in children:
+            new_cost: float = current_node.cost + step_cost
+
+            if child not in closed and (child not in best or best[child] > new_cost):
+                best[child] = new_cost
+                h = heuristic(child)
+                frontier.push((new_cost + h, h, Node(child, current_node, new_cost, h)))
+            elif stats is not None:
+                stats.duplicates += 1
+
+    return None
+
+_EXHAUSTED: Any = object()
+
+def _bounded_dfs(initial: T,
+                 goal_test: Callable[[T], bool],
+                 successors: Callable[[T], List[T]],
+                 heuristic: Callable[[T], float],
+                 bound: float,
+                 cache_size: int,
+                 stats: Optional[SearchStats] = None) -> Tuple[Optional[List[T]], float]:
+    # One iteration of iddfs/ida_star: memory is the current path (and the
+    # optional transposition cache); returns the path or the next bound
+    path: List[T] = [initial]
+    on_path: Set[T] = {initial}
+    pending: List[Iterator[T]] = [iter(_expand(initial, successors, stats, 0, 1))]
+    cache: Dict[T, int] = {}
+    next_bound: float = float('inf')
+
+    while pending:
+        child: Any = next(pending[-1], _EXHAUSTED)
+        if child is _EXHAUSTED:
+            pending.pop()
+            on_path.remove(path.pop())
+            continue
+        if child in on_path:
+            if stats is not None:
+                stats.duplicates += 1
+            continue
+
+        cost: int = len(path)
+        f: float = cost + heuristic(child)
+        if f > bound:
+            next_bound = min(next_bound, f)
+            continue
+        if cache_size:
+            # Already reached as cheap or cheaper during this iteration
+            if cache.get(child, cost + 1) <= cost:
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            if len(cache) < cache_size or child in cache:
+                cache[child] = cost
+
+        path.append(child)
+        on_path.add(child)
+        if goal_test(child):
+            return path, bound
+        pending.append(iter(_expand(child, successors, stats, len(pending), len(path) + len(cache))))
+
+    return None, next_bound
+
+def _expand(state: T,
+            successors: Callable[[T], List[T]],
+            stats: Optional[SearchStats],
+            frontier: int,
+            explored: int) -> List[T]:
+    children: List[T] = successors(state)
+    if stats is not None:
+        stats.expand(state, frontier, explored)
+        stats.generated += len(children)
+
+    return children
+
+def _path_to_node(path: List[T]) -> Node[T]:
+    node: Optional[Node[T]] = None
+    for cost, state in enumerate(path):
+        node = Node(state, node, float(cost))
+
+    return node
+
+def iddfs(initial: T,
+          goal_test: Callable[[T], bool],
+          successors: Callable[[T], List[T]],
+          max_depth: Optional[int] = None,
+          cache_size: int = 0,
+          stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    return ida_star(initial, goal_test, successors, lambda state: 0.0, max_depth, cache_size, stats)
+
+@_timed
+def ida_star(initial: T,
+             goal_test: Callable[[T], bool],
+             successors: Callable[[T], List[T]],
+             heuristic: Callable[[T], float],
+             max_cost: Optional[float] = None,
+             cache_size: int = 0,
+             stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    if goal_test(initial):
+        return Node(initial, None)
+
+    bound: float = heuristic(initial)
+    while max_cost is None or bound <= max_cost:
+        path, bound = _bounded_dfs(initial, goal_test, successors, heuristic, bound, cache_size, stats)
+        if path is not None:
+            return _path_to_node(path)
+        if bound == float('inf'):
+            return None
+
+    return None
+
+@_timed
+def bidirectional_bfs(initial: T,
+                      goal: T,
+                      successors: Callable[[T], List[T]],
+                      predecessors: Callable[[T], List[T]],
+                      stats: Optional[SearchStats] = None) -> Optional[Node[T]]:
+    # Both frontiers grow one whole layer at a time (the smaller one first)
+    # until they meet; parents point towards initial, children towards goal
+    parents: Dict[T, Optional[T]] = {initial: None}
+    children: Dict[T, Optional[T]] = {goal: None}
+    depth_forward: Dict[T, int] = {initial: 0}
+    depth_backward: Dict[T, int] = {goal: 0}
+    forward: List[T] = [initial]
+    backward: List[T] = [goal]
+    meeting: Optional[T] = initial if initial == goal else None
+
+    while meeting is None and forward and backward:
+        expand_forward: bool = len(forward) <= len(backward)
+        layer: List[T] = forward if expand_forward else backward
+        neighbours: Callable[[T], List[T]] = successors if expand_forward else predecessors
+        links: Dict[T, Optional[T]] = parents if expand_forward else children
+        depth: Dict[T, int] = depth_forward if expand_forward else depth_backward
+        other: Dict[T, int] = depth_backward if expand_forward else depth_forward
+        next_layer: List[T] = []
+        best: Optional[int] = None
+
+        for state in layer:
+            found: List[T] = _expand(state, neighbours, stats,
+                                     len(forward) + len(backward) + len(next_layer),
+                                     len(parents) + len(children))
+            for child in found:
+                if child in links:
+                    if stats is not None:
+                        stats.duplicates += 1
+                    continue
+                links[child] = state
+                depth[child] = depth[state] + 1
+                next_layer.append(child)
+                # Finish the layer: the first meeting is not always the shortest one
+                if child in other and (best is None or depth[child] + other[child] < best):
+                    best = depth[child] + other[child]
+                    meeting = child
+
+        if expand_forward:
+            forward = next_layer
+        else:
+            backward = next_layer
+
+    if meeting is None:
+        return None
+
+    chain: List[T] = []
+    state: Optional[T] = meeting
+    while state is not None:
+        chain.append(state)
+        state = parents[state]
+    chain.reverse()
+    state = children[meeting]
+    while state is not None:
+        chain.append(state)
+        state = children[state]
+
+    return _path_to_node(chain)
+
 
 
 def node_to_path(node: Node[T]) -> List[T]:
+    if isinstance(node, CompactNode):
+        return node.tree.path(node.state)
+
     path: List[T] = [node.state]
 
     # Inverted path
@@ -208,8 +886,20 @@ def node_to_path(node: Node[T]) -> List[T]:
     return path
 
 
-
 if __name__ == "__main__":
     print(linear_search([1, 5, 15, 15, 15, 15, 20], 5))
     print(binary_search(['a', 'b', 'c', 'g', 'k', 'z'], 'g'))
-    print(binary_search(['john', 'mark', 'ronald', 'sarah'], 'Luca'))
\ No newline at end of file
+    print(binary_search(['john', 'mark', 'ronald', 'sarah'], 'Luca'))
+    print(batch_binary_search(['a', 'b', 'c', 'g', 'k', 'z'], ['z', 'd', 'a']))
+    print(batch_lower_bound([1, 5, 15, 15, 15, 15, 20], [15, 0, 21]),
+          batch_upper_bound([1, 5, 15, 15, 15, 15, 20], [15, 0, 21]))
+
+    roads: Dict[str, List[Tuple[str, float]]] = {
+        'a': [('b', 7.0), ('c', 2.0)],
+        'b': [('d', 1.0)],
+        'c': [('b', 3.0), ('d', 8.0)],
+        'd': [],
+    }
+    stats: SearchStats = SearchStats()
+    route: Optional[Node[str]] = weighted_astar('a', lambda s: s == 'd', roads.__getitem__, lambda s: 0.0, stats)
+    print(node_to_path(route), route.cost, stats)
\ No newline at end of file
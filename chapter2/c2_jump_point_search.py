@@ -0,0 +1,168 @@
+"""
+Jump Point Search for 4-connected Maze grids with uniform cost.
+Canonical paths go vertical first, then horizontal:
+- horizontal jumps stop at the goal or where a vertical move is forced
+  (free cell above/below whose neighbour behind is blocked)
+- vertical jumps stop at the goal or where a horizontal jump finds something
+"""
+from typing import List, Optional, Dict, Tuple
+from heapq import heappush, heappop
+from time import perf_counter
+import random
+from c2_generic_search import astar, node_to_path, SearchStats
+from c2_maze_solution import Maze, MazeLocation, manhattan_distance
+from c2_maze_solution import DOWN, UP, RIGHT, LEFT
+
+Jump = Tuple[int, int] # (cell, step): step is +-1 horizontally or +-columns vertically
+
+
+class JumpPointSearch:
+    def __init__(self, maze: Maze) -> None:
+        self._maze: Maze = maze
+        self._columns: int = maze.columns
+        self._masks: bytes = maze.neighbour_masks
+        self._goal: int = maze.goal_id
+        self._bits: Dict[int, int] = {1: RIGHT, -1: LEFT, self._columns: DOWN, -self._columns: UP}
+
+    def _jump_horizontal(self, cell: int, step: int) -> Optional[int]:
+        masks: bytes = self._masks
+        bit: int = self._bits[step]
+        while masks[cell] & bit:
+            cell += step
+            if cell == self._goal:
+                return cell
+            here, behind = masks[cell], masks[cell - step]
+            if (here & DOWN and not behind & DOWN) or (here & UP and not behind & UP):
+                return cell
+
+        return None
+
+    def _jump_vertical(self, cell: int, step: int) -> Optional[int]:
+        masks: bytes = self._masks
+        bit: int = self._bits[step]
+        while masks[cell] & bit:
+            cell += step
+            if cell == self._goal:
+                return cell
+            if self._jump_horizontal(cell, 1) is not None or self._jump_horizontal(cell, -1) is not None:
+                return cell
+
+        return None
+
+    def _directions(self, cell: int, step: int) -> List[int]:
+        columns: int = self._columns
+        if step == 0:
+            return [columns, -columns, 1, -1]
+        if abs(step) == columns:
+            return [step, 1, -1]
+
+        # Horizontal arrival: keep going, turn only where forced
+        here, behind = self._masks[cell], self._masks[cell - step]
+        directions: List[int] = [step]
+        if here & DOWN and not behind & DOWN:
+            directions.append(columns)
+        if here & UP and not behind & UP:
+            directions.append(-columns)
+        return directions
+
+    def _distance(self, a: int, b: int) -> int:
+        (ra, ca), (rb, cb) = divmod(a, self._columns), divmod(b, self._columns)
+        return abs(ra - rb) + abs(ca - cb)
+
+    def solve(self, stats: Optional[SearchStats] = None) -> Optional[List[MazeLocation]]:
+        start: int = self._maze.start_id
+        goal: int = self._goal
+        best: Dict[int, int] = {start: 0}
+        parents: Dict[int, int] = {}
+        h: int = self._distance(start, goal)
+        frontier: List[Tuple[int, int, int, int, int]] = [(h, h, 0, start, 0)]
+
+        while frontier:
+            _, _, cost, cell, step = heappop(frontier)
+            if cost > best[cell]:
+                continue
+            if stats is not None:
+                stats.expanded += 1
+            if cell == goal:
+                return self._path(parents, cell)
+
+            for direction in self._directions(cell, step):
+                if abs(direction) == 1:
+                    jump: Optional[int] = self._jump_horizontal(cell, direction)
+                else:
+                    jump = self._jump_vertical(cell, direction)
+                if jump is None:
+                    continue
+
+                new_cost: int = cost + self._distance(cell, jump)
+                if jump not in best or best[jump] > new_cost:
+                    best[jump] = new_cost
+                    parents[jump] = cell
+                    h = self._distance(jump, goal)
+                    heappush(frontier, (new_cost + h, h, new_cost, jump, direction))
+
+        return None
+
+    def _path(self, parents: Dict[int, int], cell: int) -> List[MazeLocation]:
+        # Jump points joined by straight lines
+        path: List[MazeLocation] = [self._maze.location(cell)]
+        while cell in parents:
+            parent: int = parents[cell]
+            step: int = 1 if abs(cell - parent) < self._columns else self._columns
+            step = step if cell > parent else -step
+            while cell != parent:
+                cell -= step
+                path.append(self._maze.location(cell))
+        path.reverse()
+
+        return path
+
+def jps(maze: Maze, stats: Optional[SearchStats] = None) -> Optional[List[MazeLocation]]:
+    return JumpPointSearch(maze).solve(stats)
+
+def benchmark(sizes: Tuple[int, ...] = (100, 300, 600),
+              sparseness: float = 0.1,
+              seed: int = 42) -> List[Dict[str, float]]:
+    results: List[Dict[str, float]] = []
+
+    for size in sizes:
+        random.seed(seed)
+        maze: Maze = Maze(size, size, sparseness, goal=MazeLocation(size - 1, size - 1))
+        expanded: List[int] = [0]
+
+        def counted(ml: MazeLocation) -> List[MazeLocation]:
+            expanded[0] += 1
+            return maze.successors(ml)
+
+        start: float = perf_counter()
+        solution = astar(maze.start, maze.goal_test, counted, manhattan_distance(maze.goal))
+        astar_time: float = perf_counter() - start
+
+        stats: SearchStats = SearchStats()
+        start = perf_counter()
+        path: Optional[List[MazeLocation]] = jps(maze, stats)
+        jps_time: float = perf_counter() - start
+
+        results.append({'size': size,
+                        'astar_expanded': expanded[0], 'astar_seconds': astar_time,
+                        'astar_length': len(node_to_path(solution)) if solution else 0,
+                        'jps_expanded': stats.expanded, 'jps_seconds': jps_time,
+                        'jps_length': len(path) if path else 0})
+
+    return results
+
+
+if __name__ == "__main__":
+    m: Maze = Maze()
+    print(m)
+    path: Optional[List[MazeLocation]] = jps(m)
+    if path is None:
+        print('No solution found using JPS')
+    else:
+        m.mark(path)
+        print('JPS solution')
+        print(m)
+        m.clear(path)
+
+    for result in benchmark():
+        print(result)
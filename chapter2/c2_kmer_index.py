@@ -0,0 +1,186 @@
+"""
+k-mer position index: every k nucleotides get an integer code (0..4^k - 1,
+2 bits per nucleotide, the first one in the highest bits) and the index keeps
+the start positions of each code in one posting list.
+
+Index file:
+- 4 bytes magic: b'KMER'
+- 8 bytes big endian each: k, step, gene length, number of positions
+- offsets: 4^k + 1 native array('I'), the postings of code c are
+  positions[offsets[c]:offsets[c + 1]]
+- positions: native array('I')
+"""
+from __future__ import annotations
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from typing import List, Union, Optional, Sequence, BinaryIO
+from array import array
+from mmap import mmap, ACCESS_READ
+from random import choice
+from time import perf_counter
+from chapter1.c1_compression import ENCODE_TABLE, INVALID
+from c2_packed_search import Pattern, pattern_to_str
+
+MAGIC: bytes = b'KMER'
+HEADER_SIZE: int = len(MAGIC) + 4 * 8
+MAX_POSITION: int = (1 << 32) - 1
+
+Kmer = Union[Pattern, int]
+
+def encode_kmer(kmer: Pattern) -> int:
+    codes: bytes = pattern_to_str(kmer).encode('ascii', 'replace').translate(ENCODE_TABLE)
+    if INVALID in codes:
+        raise ValueError('Nucleotide invalid in k-mer: {}'.format(pattern_to_str(kmer)))
+    code: int = 0
+    for nucleotide in codes:
+        code = (code << 2) | nucleotide
+    return code
+
+def decode_kmer(code: int, k: int) -> str:
+    return ''.join(['ACGT'[(code >> shift) & 0b11] for shift in range(2 * k - 2, -2, -2)])
+
+
+class KmerIndex:
+    def __init__(self, k: int, step: int, length: int, offsets: Sequence[int], positions: Sequence[int]) -> None:
+        self.k: int = k
+        self.step: int = step
+        self.length: int = length
+        self._codes: int = 1 << (2 * k)
+        self._offsets: Sequence[int] = offsets
+        self._positions: Sequence[int] = positions
+        self._data: Optional[mmap] = None
+        self._file: Optional[BinaryIO] = None
+
+    @classmethod
+    def build(cls, gene: Union[str, bytes], k: int = 3, step: Optional[int] = None) -> KmerIndex:
+        # step=k (the default) indexes the codons of str_to_gene, step=1 every k-mer
+        step = k if step is None else step
+        raw: bytes = gene.encode('ascii', 'replace') if isinstance(gene, str) else bytes(gene)
+        codes: bytes = raw.translate(ENCODE_TABLE)
+        bad: int = codes.find(INVALID)
+        if bad != -1:
+            raise ValueError('Nucleotide invalid: {}'.format(chr(raw[bad])))
+        if len(codes) > MAX_POSITION:
+            raise ValueError('Gene too long for 32 bit positions: {}'.format(len(codes)))
+
+        # One pass: a rolling code, every window start goes to its posting list
+        mask: int = (1 << (2 * k)) - 1
+        postings: List[array] = [array('I') for _ in range(1 << (2 * k))]
+        code: int = 0
+        for end, nucleotide in enumerate(codes, 1 - k):
+            code = ((code << 2) | nucleotide) & mask
+            if end >= 0 and end % step == 0:
+                postings[code].append(end)
+
+        offsets: array = array('I', [0])
+        positions: array = array('I')
+        for posting in postings:
+            positions.extend(posting)
+            offsets.append(len(positions))
+
+        return cls(k, step, len(codes), offsets, positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, kmer: Kmer) -> bool:
+        return self.count(kmer) > 0
+
+    def __enter__(self) -> KmerIndex:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def code(self, kmer: Kmer) -> int:
+        if isinstance(kmer, int):
+            if not 0 <= kmer < self._codes:
+                raise ValueError('{}-mer code out of range: {}'.format(self.k, kmer))
+            return kmer
+        if len(kmer) != self.k:
+            raise ValueError('Expected a {}-mer, got {}'.format(self.k, pattern_to_str(kmer)))
+        return encode_kmer(kmer)
+
+    def count(self, kmer: Kmer) -> int:
+        code: int = self.code(kmer)
+        return self._offsets[code + 1] - self._offsets[code]
+
+    def positions(self, kmer: Kmer) -> array:
+        # Nucleotide offsets; for the default codon frame codon index = position // 3.
+        # Always a copy, so no view into a loaded file outlives close()
+        code: int = self.code(kmer)
+        return array('I', self._positions[self._offsets[code]:self._offsets[code + 1]])
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as output:
+            output.write(MAGIC)
+            for value in (self.k, self.step, self.length, len(self._positions)):
+                output.write(value.to_bytes(8, 'big'))
+            array('I', self._offsets).tofile(output)
+            array('I', self._positions).tofile(output)
+
+    @classmethod
+    def load(cls, path: str) -> KmerIndex:
+        source: BinaryIO = open(path, 'rb')
+        try:
+            data: mmap = mmap(source.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            source.close()
+            raise ValueError('Empty k-mer index file: {}'.format(path))
+
+        if data[:len(MAGIC)] != MAGIC:
+            data.close()
+            source.close()
+            raise ValueError('Invalid k-mer index file: {}'.format(path))
+        k, step, length, total = [int.from_bytes(data[start:start + 8], 'big')
+                                  for start in range(len(MAGIC), HEADER_SIZE, 8)]
+
+        # The header is a multiple of 4 bytes, so both casts are aligned
+        view: memoryview = memoryview(data)
+        middle: int = HEADER_SIZE + ((1 << (2 * k)) + 1) * 4
+        index: KmerIndex = cls(k, step, length,
+                               view[HEADER_SIZE:middle].cast('I'),
+                               view[middle:middle + total * 4].cast('I'))
+        view.release()
+        index._data = data
+        index._file = source
+        return index
+
+    def close(self) -> None:
+        if self._data is None:
+            return
+        self._offsets.release()
+        self._positions.release()
+        self._data.close()
+        self._file.close()
+        self._data = None
+        self._file = None
+
+
+if __name__ == "__main__":
+    import tempfile
+    from c2_linear_search import str_to_gene, Nucleotide
+
+    gene_str: str = ''.join([choice('ACGT') for _ in range(3_000_000)])
+    start: float = perf_counter()
+    index: KmerIndex = KmerIndex.build(gene_str)
+    print('Built {} codons in {:.2f}s'.format(len(index), perf_counter() - start))
+
+    path: str = os.path.join(tempfile.mkdtemp(), 'gene.kmer')
+    index.save(path)
+    with KmerIndex.load(path) as loaded:
+        acg = (Nucleotide.A, Nucleotide.C, Nucleotide.G)
+        print('ACG: {} times, first codons {}'.format(loaded.count(acg),
+                                                    [p // 3 for p in loaded.positions(acg)[:5]]))
+
+        codes: List[int] = list(range(64)) * 20_000
+        start = perf_counter()
+        sum([loaded.count(code) for code in codes])
+        print('{:,.0f} lookups per second'.format(len(codes) / (perf_counter() - start)))
+
+        gene = str_to_gene(gene_str)
+        start = perf_counter()
+        print('ACG by scanning: {} times in {:.3f}s'.format(gene.count(acg), perf_counter() - start))
+    os.remove(path)
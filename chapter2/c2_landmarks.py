@@ -0,0 +1,141 @@
+"""
+ALT heuristic (A*, Landmarks, Triangle inequality) for repeated Maze queries.
+With d(L, x) the BFS distance from landmark L:
+h(x) = max over L of |d(L, goal) - d(L, x)| <= real distance(x, goal)
+"""
+from __future__ import annotations
+from typing import List, Callable, Optional, Deque, BinaryIO, Tuple
+from array import array
+from collections import deque
+from zlib import crc32
+from time import perf_counter
+import random
+from c2_generic_search import astar, node_to_path, Node
+from c2_maze_solution import Maze, MazeLocation, manhattan_distance
+
+MAGIC: bytes = b'ALT1'
+UNREACHABLE: int = -1
+
+def bfs_distances(maze: Maze, source: int) -> array:
+    masks: bytes = maze.neighbour_masks
+    offsets: List[Tuple[int, ...]] = maze.neighbour_offsets
+    distances: array = array('i', [UNREACHABLE]) * len(masks)
+    distances[source] = 0
+    frontier: Deque[int] = deque([source])
+
+    while frontier:
+        cell: int = frontier.popleft()
+        distance: int = distances[cell] + 1
+        for offset in offsets[masks[cell]]:
+            if distances[cell + offset] == UNREACHABLE:
+                distances[cell + offset] = distance
+                frontier.append(cell + offset)
+
+    return distances
+
+
+class Landmarks:
+    def __init__(self, maze: Maze, landmarks: List[int], tables: List[array]) -> None:
+        self._maze: Maze = maze
+        self.landmarks: List[int] = landmarks
+        self._tables: List[array] = tables
+        # The distances only hold for the maze as it was when they were computed
+        self.version: int = maze.version
+
+    @classmethod
+    def build(cls, maze: Maze, k: int = 4) -> Landmarks:
+        # Farthest point selection, starting from maze.start: every new landmark
+        # is the cell farthest from the ones already chosen
+        reach: array = bfs_distances(maze, maze.start_id)
+        landmarks: List[int] = []
+        tables: List[array] = []
+        closest: List[int] = list(reach)
+
+        for _ in range(k):
+            candidate: int = max(range(len(closest)), key=closest.__getitem__)
+            if closest[candidate] <= 0:
+                break
+            table: array = bfs_distances(maze, candidate)
+            landmarks.append(candidate)
+            tables.append(table)
+            closest = [min(a, b) if a != UNREACHABLE else UNREACHABLE for a, b in zip(closest, table)]
+
+        return cls(maze, landmarks, tables)
+
+    @staticmethod
+    def _fingerprint(maze: Maze) -> int:
+        return crc32(maze.neighbour_masks)
+
+    def alt_heuristic(self, goal: MazeLocation) -> Callable[[MazeLocation], float]:
+        if self.version != self._maze.version:
+            raise ValueError('Landmarks are stale: the maze changed since they were built')
+        maze: Maze = self._maze
+        columns: int = maze.columns
+        goal_id: int = self._maze.cell_id(goal)
+        pairs = [(table, table[goal_id]) for table in self._tables if table[goal_id] != UNREACHABLE]
+        fallback: Callable[[MazeLocation], float] = manhattan_distance(goal)
+
+        def distance(ml: MazeLocation) -> float:
+            if self.version != maze.version:
+                raise ValueError('Landmarks are stale: the maze changed since they were built')
+            cell: int = ml.row * columns + ml.column
+            best: float = fallback(ml)
+            for table, to_goal in pairs:
+                here: int = table[cell]
+                if here != UNREACHABLE and abs(to_goal - here) > best:
+                    best = abs(to_goal - here)
+            return best
+        return distance
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as output:
+            output.write(MAGIC)
+            for value in (self._maze.rows, self._maze.columns, self._fingerprint(self._maze), len(self.landmarks)):
+                output.write(value.to_bytes(8, 'big'))
+            array('q', self.landmarks).tofile(output)
+            for table in self._tables:
+                table.tofile(output)
+
+    @classmethod
+    def load(cls, path: str, maze: Maze) -> Landmarks:
+        with open(path, 'rb') as source:
+            if source.read(len(MAGIC)) != MAGIC:
+                raise ValueError('Invalid landmark file: {}'.format(path))
+            rows, columns, fingerprint, k = [int.from_bytes(source.read(8), 'big') for _ in range(4)]
+            if (rows, columns, fingerprint) != (maze.rows, maze.columns, cls._fingerprint(maze)):
+                raise ValueError('Landmark file {} was built for a different maze'.format(path))
+
+            landmarks: array = array('q')
+            landmarks.fromfile(source, k)
+            tables: List[array] = [cls._read_table(source, rows * columns) for _ in range(k)]
+
+        return cls(maze, list(landmarks), tables)
+
+    @staticmethod
+    def _read_table(source: BinaryIO, size: int) -> array:
+        table: array = array('i')
+        table.fromfile(source, size)
+        return table
+
+
+if __name__ == "__main__":
+    random.seed(7)
+    m: Maze = Maze(200, 200, 0.25, goal=MazeLocation(199, 199))
+    landmarks: Landmarks = Landmarks.build(m, k=6)
+    print('Landmarks: {}'.format([m.location(cell) for cell in landmarks.landmarks]))
+
+    queries = [(MazeLocation(random.randrange(200), random.randrange(200)),
+                MazeLocation(random.randrange(200), random.randrange(200))) for _ in range(20)]
+
+    def counted(ml: MazeLocation) -> List[MazeLocation]:
+        expanded[0] += 1
+        return m.successors(ml)
+
+    for name, heuristic in (('manhattan', manhattan_distance), ('alt', landmarks.alt_heuristic)):
+        expanded: List[int] = [0]
+        start: float = perf_counter()
+        lengths: List[int] = []
+        for source, goal in queries:
+            solution: Optional[Node[MazeLocation]] = astar(source, lambda ml: ml == goal, counted, heuristic(goal))
+            lengths.append(len(node_to_path(solution)) if solution else 0)
+        print('{}: {:.3f}s, {} expanded, {}'.format(name, perf_counter() - start, expanded[0], lengths))
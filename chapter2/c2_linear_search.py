@@ -6,12 +6,19 @@ gene: a sequence of codons
 """
 
 from enum import IntEnum
-from typing import Tuple, List
+from typing import Tuple, List, Union
+from array import array
 from random import choice
+from sys import getsizeof
 
 Nucleotide: IntEnum = IntEnum('Nucleotide', ('A', 'C', 'G', 'T'))
 Codon = Tuple[Nucleotide, Nucleotide, Nucleotide]
 Gene = List[Codon]
+# Codon codes: 6 bits, the first nucleotide in the highest two (A=0, C=1, G=2, T=3),
+# so codes sort in the same order as the Codon tuples
+CodedGene = Union[bytes, array]
+INVALID: int = 0xFF
+CODE_TABLE: bytes = bytes({ord('A'): 0, ord('C'): 1, ord('G'): 2, ord('T'): 3}.get(i, INVALID) for i in range(256))
 
 def str_to_gene(s: str) -> Gene:
     gene: Gene = []
@@ -31,6 +38,36 @@ def linear_search(gene: Gene, search_term: Codon) -> bool:
             return True
     return False
 
+def codon_to_code(codon: Codon) -> int:
+    return ((codon[0] - 1) << 4) | ((codon[1] - 1) << 2) | (codon[2] - 1)
+
+def code_to_codon(code: int) -> Codon:
+    return (Nucleotide((code >> 4) + 1), Nucleotide(((code >> 2) & 0b11) + 1), Nucleotide((code & 0b11) + 1))
+
+def gene_to_codes(gene: Gene) -> bytes:
+    return bytes([codon_to_code(codon) for codon in gene])
+
+def codes_to_gene(codes: CodedGene) -> Gene:
+    return [code_to_codon(code) for code in codes]
+
+def str_to_codes(s: Union[str, bytes]) -> bytes:
+    # Same codons as str_to_gene (an incomplete last codon is dropped), one byte each
+    raw: bytes = s.encode('ascii', 'replace') if isinstance(s, str) else bytes(s)
+    nucleotides: bytes = raw[:len(raw) - len(raw) % 3].translate(CODE_TABLE)
+    bad: int = nucleotides.find(INVALID)
+    if bad != -1:
+        raise KeyError(chr(raw[bad]))
+
+    size: int = len(nucleotides) // 3
+    # Every byte of the three ints is a codon lane; codes stay < 64, nothing carries
+    packed: int = (int.from_bytes(nucleotides[0::3], 'big') << 4) | \
+        (int.from_bytes(nucleotides[1::3], 'big') << 2) | int.from_bytes(nucleotides[2::3], 'big')
+    return packed.to_bytes(size, 'big')
+
+def linear_search_codes(codes: CodedGene, search_term: Union[Codon, int]) -> bool:
+    code: int = search_term if isinstance(search_term, int) else codon_to_code(search_term)
+    return code in codes
+
 
 
 if __name__ == "__main__":
@@ -47,3 +84,9 @@ if __name__ == "__main__":
 
     print(acg in my_gene) # Every class implemented __contains__ can do this
 
+    my_codes: bytes = str_to_codes(gene_str)
+    print(linear_search_codes(my_codes, acg), linear_search_codes(my_codes, gat))
+    print('{} bytes per codon instead of {}'.format(
+        getsizeof(my_codes) / max(1, len(my_codes)),
+        (getsizeof(my_gene) + sum([getsizeof(codon) for codon in my_gene])) / max(1, len(my_gene))))
+
@@ -1,10 +1,12 @@
 from enum import Enum
-from typing import List, NamedTuple, Callable, Optional
+from typing import List, NamedTuple, Callable, Optional, Tuple, Deque
+from collections import deque
 import random
 from math import sqrt
 from c2_generic_search import dfs, node_to_path, Node
 from c2_generic_search import bfs
 from c2_generic_search import astar
+from c2_generic_search import bidirectional_bfs
 
 class Cell(str, Enum):
     EMPTY = ' '
@@ -19,7 +21,16 @@ class MazeLocation(NamedTuple):
     column: int
 
 
+# Neighbour bits of a cell, same order as successors: down, up, right, left
+DOWN: int = 0b0001
+UP: int = 0b0010
+RIGHT: int = 0b0100
+LEFT: int = 0b1000
+OPEN_TABLE: bytes = bytes(0 if i == ord(Cell.BLOCKED.value) else 1 for i in range(256))
+
+
 class Maze:
+    # The grid is a bytearray with the Cell character of each cell (cell id = row * columns + column)
     def __init__(self,
                  rows: int = 10,
                  columns: int = 10,
@@ -30,54 +41,175 @@ class Maze:
         self._columns: int = columns
         self.start: MazeLocation = start
         self.goal: MazeLocation = goal
-        self._grid: List[List[Cell]] = [[Cell.EMPTY for c in range(columns)] for r in range(rows)]
+        self._grid: bytearray = bytearray(Cell.EMPTY.value.encode() * (rows * columns))
+        # Bumped whenever the open cells change, so cached search results can tell
+        self.version: int = 0
         self._randomly_fill(rows, columns, sparseness)
-        self._grid[start.row][start.column] = Cell.START
-        self._grid[goal.row][goal.column] = Cell.GOAL
-        
+        self._set(start, Cell.START)
+        self._set(goal, Cell.GOAL)
+        self._build_neighbours()
+        self._offsets: List[Tuple[int, ...]] = [
+            tuple(offset for bit, offset in ((DOWN, columns), (UP, -columns), (RIGHT, 1), (LEFT, -1))
+                  if mask & bit)
+            for mask in range(16)]
+        self._moves: List[Tuple[Tuple[int, int], ...]] = [
+            tuple(move for bit, move in ((DOWN, (1, 0)), (UP, (-1, 0)), (RIGHT, (0, 1)), (LEFT, (0, -1)))
+                  if mask & bit)
+            for mask in range(16)]
+
     def __str__(self) -> str:
         output: str = ''
-        for row in self._grid:
-            output += ''.join([c for c in row]) + '\n'
+        text: str = self._grid.decode()
+        for row in range(self._rows):
+            output += text[row * self._columns:(row + 1) * self._columns] + '\n'
 
         return output
 
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    def _set(self, ml: MazeLocation, cell: Cell) -> None:
+        self._grid[ml.row * self._columns + ml.column] = ord(cell.value)
+
     def _randomly_fill(self,
                        rows: int,
                        columns: int,
                        sparseness: int) -> None:
-        for row in range(rows):
-            for column in range(columns):
-                if random.uniform(0, 1.0) < sparseness:
-                    self._grid[row][column] = Cell.BLOCKED
+        # One random byte per cell, turned into cells by a 256 entry table
+        threshold: int = round(sparseness * 256)
+        table: bytes = bytes(ord(Cell.BLOCKED.value) if i < threshold else ord(Cell.EMPTY.value)
+                             for i in range(256))
+        self._grid[:] = random.randbytes(rows * columns).translate(table)
+
+    def _build_neighbours(self) -> None:
+        # Neighbour bit masks for every cell, built with whole-grid shifts
+        rows, columns = self._rows, self._columns
+        size: int = rows * columns
+        if size == 0:
+            self._neighbours: bytearray = bytearray()
+            return
+        open_cells: int = int.from_bytes(self._grid.translate(OPEN_TABLE), 'big')
+        not_first: int = int.from_bytes((b'\x00' + b'\x01' * (columns - 1)) * rows, 'big')
+        not_last: int = int.from_bytes((b'\x01' * (columns - 1) + b'\x00') * rows, 'big')
+
+        # Cell i is byte i counting from the highest one: "cell + k" is a shift of 8k bits to the left
+        down: int = (open_cells << (8 * columns)) & ((1 << (8 * size)) - 1)
+        up: int = open_cells >> (8 * columns)
+        right: int = ((open_cells << 8) & ((1 << (8 * size)) - 1)) & not_last
+        left: int = (open_cells >> 8) & not_first
+        masks: int = down * DOWN | up * UP | right * RIGHT | left * LEFT
+
+        # Mutable, so set_blocked only rewrites the cells around the change
+        self._neighbours = bytearray(masks.to_bytes(size, 'big'))
+
+    def _update_neighbour_mask(self, cell: int) -> None:
+        row, column = divmod(cell, self._columns)
+        mask: int = 0
+        for bit, inside, offset in ((DOWN, row + 1 < self._rows, self._columns),
+                                    (UP, row > 0, -self._columns),
+                                    (RIGHT, column + 1 < self._columns, 1),
+                                    (LEFT, column > 0, -1)):
+            if inside and OPEN_TABLE[self._grid[cell + offset]]:
+                mask |= bit
+        self._neighbours[cell] = mask
+
+    @property
+    def neighbour_masks(self) -> bytearray:
+        return self._neighbours
+
+    @property
+    def neighbour_offsets(self) -> List[Tuple[int, ...]]:
+        # mask -> cell id offsets of its open neighbours, in DOWN, UP, RIGHT, LEFT order
+        return self._offsets
+
+    def cell_id(self, ml: MazeLocation) -> int:
+        return ml.row * self._columns + ml.column
+
+    def location(self, cell: int) -> MazeLocation:
+        return MazeLocation(*divmod(cell, self._columns))
+
+    @property
+    def start_id(self) -> int:
+        return self.cell_id(self.start)
+
+    @property
+    def goal_id(self) -> int:
+        return self.cell_id(self.goal)
 
     def goal_test(self, ml: MazeLocation) -> bool:
         return ml == self.goal
 
+    def goal_id_test(self, cell: int) -> bool:
+        return cell == self.goal_id
+
     def successors(self, ml: MazeLocation) -> List[MazeLocation]:
-        locations: List[MazeLocation] = []
-        if ml.row + 1 < self._rows and self._grid[ml.row + 1][ml.column] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row + 1, ml.column))
-        if ml.row - 1 >= 0 and self._grid[ml.row - 1][ml.column] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row - 1, ml.column))
-        if ml.column + 1 < self._columns and self._grid[ml.row][ml.column + 1] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row, ml.column + 1))
-        if ml.column - 1 >= 0 and self._grid[ml.row][ml.column - 1] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row, ml.column - 1))
-
-        return locations
+        row, column = ml
+        return [MazeLocation(row + dr, column + dc)
+                for dr, dc in self._moves[self._neighbours[row * self._columns + column]]]
+
+    def successor_ids(self, cell: int) -> List[int]:
+        return [cell + offset for offset in self._offsets[self._neighbours[cell]]]
+
+    def set_blocked(self, ml: MazeLocation, blocked: bool = True) -> None:
+        if ml == self.start or ml == self.goal:
+            raise ValueError('Start and goal cannot be blocked: {}'.format(ml))
+        self._set(ml, Cell.BLOCKED if blocked else Cell.EMPTY)
+        # Only the masks of the (up to) four neighbours point at the changed cell
+        for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if 0 <= ml.row + dr < self._rows and 0 <= ml.column + dc < self._columns:
+                self._update_neighbour_mask((ml.row + dr) * self._columns + ml.column + dc)
+        self.version += 1
 
     def mark(self, path: List[MazeLocation]) -> None:
         for maze_location in path:
-            self._grid[maze_location.row][maze_location.column] = Cell.PATH
-        self._grid[self.start.row][self.start.column] = Cell.START        
-        self._grid[self.goal.row][self.goal.column] = Cell.GOAL
+            self._set(maze_location, Cell.PATH)
+        self._set(self.start, Cell.START)
+        self._set(self.goal, Cell.GOAL)
     
     def clear(self, path: List[MazeLocation]) -> None:
         for maze_location in path:
-            self._grid[maze_location.row][maze_location.column] = Cell.EMPTY
-        self._grid[self.start.row][self.start.column] = Cell.START        
-        self._grid[self.goal.row][self.goal.column] = Cell.GOAL
+            self._set(maze_location, Cell.EMPTY)
+        self._set(self.start, Cell.START)
+        self._set(self.goal, Cell.GOAL)
+
+
+def grid_bfs(maze: Maze) -> Optional[List[MazeLocation]]:
+    # bfs on cell ids with flat byte arrays, for mazes too big for Node objects.
+    # came_from keeps the index + 1 of the move that reached each cell (0: not reached)
+    start: int = maze.start_id
+    goal: int = maze.goal_id
+    offsets: Tuple[int, ...] = maze.neighbour_offsets[DOWN | UP | RIGHT | LEFT]
+    moves: List[Tuple[Tuple[int, int], ...]] = [
+        tuple((offsets.index(offset) + 1, offset) for offset in table) for table in maze.neighbour_offsets]
+    neighbours: bytes = maze.neighbour_masks
+    came_from: bytearray = bytearray(maze.rows * maze.columns)
+    came_from[start] = 5
+    frontier: Deque[int] = deque([start])
+    pop: Callable[[], int] = frontier.popleft
+    push: Callable[[int], None] = frontier.append
+
+    while frontier:
+        cell: int = pop()
+        if cell == goal:
+            path: List[MazeLocation] = [maze.location(cell)]
+            while cell != start:
+                cell -= offsets[came_from[cell] - 1]
+                path.append(maze.location(cell))
+            path.reverse()
+            return path
+
+        for move, offset in moves[neighbours[cell]]:
+            child: int = cell + offset
+            if not came_from[child]:
+                came_from[child] = move
+                push(child)
+
+    return None
 
 
 def euclidean_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
@@ -131,4 +263,14 @@ if __name__ == "__main__":
         m.mark(path3)
         print('A* solution')
         print(m)
-        m.clear(path3)
\ No newline at end of file
+        m.clear(path3)
+
+    solution4: Optional[Node[MazeLocation]] = bidirectional_bfs(m.start, m.goal, m.successors, m.successors)
+    if solution4 is None:
+        print('No solution found using bidirectional BFS')
+    else:
+        path4: List[MazeLocation] = node_to_path(solution4)
+        m.mark(path4)
+        print('Bidirectional BFS solution')
+        print(m)
+        m.clear(path4)
\ No newline at end of file
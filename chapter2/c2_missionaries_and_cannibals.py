@@ -1,82 +1,142 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple, Any
+from time import perf_counter
 from c2_generic_search import bfs, Node, node_to_path
 
 MAX_NUM: int = 3
+BOAT_CAPACITY: int = 2
+
+Move = Tuple[int, int] # (missionaries, cannibals) in the boat
+
+class MCProblem:
+    # N missionaries, N cannibals (can differ) and a boat for C people;
+    # boat loads are computed once and states are interned
+    def __init__(self,
+                 missionaries: int = MAX_NUM,
+                 cannibals: int = MAX_NUM,
+                 capacity: int = BOAT_CAPACITY) -> None:
+        self.missionaries: int = missionaries
+        self.cannibals: int = cannibals
+        self.capacity: int = capacity
+        self.moves: List[Move] = [(m, c) for m in range(capacity + 1) for c in range(capacity + 1 - m)
+                                  if m + c > 0]
+        self._states: Dict[int, MCState] = {}
+
+    def __repr__(self) -> str:
+        return 'MCProblem({}, {}, {})'.format(self.missionaries, self.cannibals, self.capacity)
+
+    def key(self, missionaries: int, cannibals: int, boat: bool) -> int:
+        return (missionaries * (self.cannibals + 1) + cannibals) * 2 + boat
+
+    def state(self, missionaries: int, cannibals: int, boat: bool) -> MCState:
+        found: Optional[MCState] = self._states.get(self.key(missionaries, cannibals, boat))
+        if found is None:
+            found = MCState(missionaries, cannibals, boat, self)
+            self._states[found.key] = found
+        return found
+
+    @property
+    def start(self) -> MCState:
+        return self.state(self.missionaries, self.cannibals, True)
+
+    def is_legal(self, missionaries: int, cannibals: int) -> bool:
+        east_m: int = self.missionaries - missionaries
+        east_c: int = self.cannibals - cannibals
+        if 0 < missionaries < cannibals:
+            return False
+        if 0 < east_m < east_c:
+            return False
+
+        return True
+
+
+DEFAULT_PROBLEM: MCProblem = MCProblem()
+
 
 class MCState:
+    # Immutable west bank counts and boat side; equal states hash alike
+    __slots__ = ('wm', 'wc', 'boat', 'problem', 'key')
+
     def __init__(self,
                  missionaries: int,
                  cannibals: int,
-                 boat: bool) -> None:
-        
-        self.wm: int = missionaries
-        self.wc: int = cannibals
-        self.em: int = MAX_NUM
-        self.ec: int = MAX_NUM
-        self.boat: bool = boat
-    
+                 boat: bool,
+                 problem: MCProblem = DEFAULT_PROBLEM) -> None:
+        object.__setattr__(self, 'wm', missionaries)
+        object.__setattr__(self, 'wc', cannibals)
+        object.__setattr__(self, 'boat', boat)
+        object.__setattr__(self, 'problem', problem)
+        object.__setattr__(self, 'key', problem.key(missionaries, cannibals, boat))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('MCState is immutable')
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MCState):
+            return NotImplemented
+        return self.key == other.key and \
+            (self.problem is other.problem or repr(self.problem) == repr(other.problem))
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return 'MCState({}, {}, {})'.format(self.wm, self.wc, self.boat)
+
     def __str__(self) -> str:
         return ('West Bank: {} missionaries and {} cannibals.\n'
                 'East Bank: {} missionaries and {} cannibals.\n'
                 'The boat at: {}')\
             .format(self.wm, self.wc, self.em, self.ec, ('west' if self.boat else 'east'))
-    
+
+    @property
+    def em(self) -> int:
+        return self.problem.missionaries - self.wm
+
+    @property
+    def ec(self) -> int:
+        return self.problem.cannibals - self.wc
+
     def goal_test(self) -> bool:
-        return self.is_legal and self.em == MAX_NUM and self.ec == MAX_NUM
+        return self.is_legal and self.em == self.problem.missionaries and self.ec == self.problem.cannibals
 
     @property
     def is_legal(self) -> bool:
-        if self.wm < self.wc and self.wm > 0:
-            return False
-        if self.em < self.ec and self.em > 0:
-            return False
-        
-        return True
-    
+        return self.problem.is_legal(self.wm, self.wc)
+
     def successors(self) -> List[MCState]:
+        problem: MCProblem = self.problem
         sucs: List[MCState] = []
+        # The boat takes people away from its bank: west if boat, else east
+        sign: int = -1 if self.boat else 1
+        available_m: int = self.wm if self.boat else self.em
+        available_c: int = self.wc if self.boat else self.ec
 
-        if self.boat:
-            if self.wm > 1:
-                sucs.append(MCState(self.wm - 2, self.wc, not self.boat))
-            if self.wm > 0:
-                sucs.append(MCState(self.wm - 1, self.wc, not self.boat))
-            if self.wc > 1:
-                sucs.append(MCState(self.wm, self.wc - 2, not self.boat))
-            if self.wc > 0:
-                sucs.append(MCState(self.wm, self.wc - 1, not self.boat))
-            if (self.wc > 0) and (self.wm > 0):
-                sucs.append(MCState(self.wm - 1, self.wc - 1, not self.boat))
-        else:
-            if self.em > 1:
-                sucs.append(MCState(self.wm + 2, self.wc, not self.boat))
-            if self.em > 0:
-                sucs.append(MCState(self.wm + 1, self.wc, not self.boat))
-            if self.ec > 1:
-                sucs.append(MCState(self.wm, self.wc + 2, not self.boat))
-            if self.ec > 0:
-                sucs.append(MCState(self.wm, self.wc + 1, not self.boat))
-            if (self.ec > 0) and (self.em > 0):
-                sucs.append(MCState(self.wm + 1, self.wc + 1, not self.boat))
-        return [x for x in sucs if x.is_legal]
+        for m, c in problem.moves:
+            if m > available_m or c > available_c:
+                continue
+            wm: int = self.wm + sign * m
+            wc: int = self.wc + sign * c
+            if problem.is_legal(wm, wc):
+                sucs.append(problem.state(wm, wc, not self.boat))
+        return sucs
 
 def display_solution(path: List[MCState]):
     if len(path) == 0:
         return
-    
+
     old_state: MCState = path[0]
     print(old_state)
     for current_state in path[1:]:
         if current_state.boat:
-            print('{} Missionaries | {} Cannibals moved from west to east.\n'
+            print('{} Missionaries | {} Cannibals moved from east to west.\n'
                 .format(old_state.em - current_state.em, old_state.ec - current_state.ec))
         else:
-            print('{} Missionaries | {} Cannibals moved from east to west.\n'
+            print('{} Missionaries | {} Cannibals moved from west to east.\n'
                 .format(old_state.wm - current_state.wm, old_state.wc - current_state.wc))
         print(current_state)
         old_state = current_state
-    
+
 
 if __name__ == "__main__":
     start: MCState = MCState(MAX_NUM, MAX_NUM, True)
@@ -85,4 +145,10 @@ if __name__ == "__main__":
         print('No solution found.')
     else:
         path: List[MCState] = node_to_path(solution)
-        display_solution(path)
\ No newline at end of file
+        display_solution(path)
+
+    big: MCProblem = MCProblem(1000, 1000, 10)
+    begin: float = perf_counter()
+    solution = bfs(big.start, MCState.goal_test, MCState.successors)
+    print('{}: {} crossings in {:.1f} ms'.format(big, len(node_to_path(solution)) - 1 if solution else None,
+                                                (perf_counter() - begin) * 1000))
@@ -0,0 +1,92 @@
+"""
+Search straight on the 2-bit packed form of GeneCompression.
+The whole sequence is a single Python int, used as one very wide word:
+every nucleotide is a 2 bit lane and one pattern position is checked
+for every lane at once with a few shifts, XORs and ANDs.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from typing import List, Union, Sequence, Tuple
+import re
+from random import choice
+from enum import IntEnum
+from chapter1.c1_compression import GeneCompression, pack_nucleotides
+
+Pattern = Union[str, Sequence[IntEnum]]
+NONZERO: re.Pattern = re.compile(rb'[^\x00]')
+# Lanes (0-3, first one in the highest bits) whose low bit is set in a byte
+LANES: List[Tuple[int, ...]] = [tuple(lane for lane in range(4) if byte & (1 << (6 - 2 * lane)))
+                                for byte in range(256)]
+
+def pattern_to_str(pattern: Pattern) -> str:
+    # Accepts 'ACG' or the (Nucleotide.A, Nucleotide.C, Nucleotide.G) codons of chapter 2
+    if isinstance(pattern, str):
+        return pattern.upper()
+    return ''.join([nucleotide.name for nucleotide in pattern])
+
+
+class PackedGeneSearch:
+    def __init__(self, gene: GeneCompression) -> None:
+        self._length: int = len(gene)
+        self._lanes: int = len(gene.packed) * 4
+        value: int = int.from_bytes(gene.packed, 'big')
+        full: int = (1 << (2 * self._lanes)) - 1
+        low: int = int.from_bytes(b'\x55' * len(gene.packed), 'big')
+
+        # One bit (the low bit of each lane) set where the nucleotide equals the code
+        self._equal: List[int] = []
+        for code in range(4):
+            same: int = ~(value ^ (low * code)) & full
+            self._equal.append(same & (same >> 1) & low)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, pattern: Pattern) -> bool:
+        return len(self.find(pattern)) > 0
+
+    def find(self, pattern: Pattern) -> List[int]:
+        codes: bytes = pack_nucleotides(pattern_to_str(pattern))
+        size: int = len(pattern)
+        if size == 0 or size > self._length:
+            return []
+
+        matches: int = -1
+        for j in range(size):
+            code: int = (codes[j // 4] >> (6 - 2 * (j % 4))) & 0b11
+            # Lane i + j moved onto lane i
+            matches &= self._equal[code] << (2 * j)
+
+        return self._positions(matches, self._length - size)
+
+    def find_codon(self, codon: Pattern) -> List[int]:
+        # Only the codons of str_to_gene (reading frame 0), as codon indexes
+        return [position // 3 for position in self.find(codon) if position % 3 == 0]
+
+    def _positions(self, matches: int, last: int) -> List[int]:
+        # One byte holds 4 lanes; only the non zero bytes are decoded
+        data: bytes = (matches & ((1 << (2 * self._lanes)) - 1)).to_bytes(self._lanes // 4, 'big')
+        positions: List[int] = []
+        for found in NONZERO.finditer(data):
+            base: int = found.start() * 4
+            for lane in LANES[data[found.start()]]:
+                if base + lane > last:
+                    return positions
+                positions.append(base + lane)
+
+        return positions
+
+def find_pattern(gene: GeneCompression, pattern: Pattern) -> List[int]:
+    return PackedGeneSearch(gene).find(pattern)
+
+
+if __name__ == "__main__":
+    gene_str: str = ''.join([choice(['A', 'C', 'G', 'T']) for i in range(0, 64)])
+    print(gene_str)
+
+    search: PackedGeneSearch = PackedGeneSearch(GeneCompression(gene_str))
+    print('ACG at: {}'.format(search.find('ACG')))
+    print('GAT codons: {}'.format(search.find_codon('GAT')))
+    print('ACG' in search)
@@ -0,0 +1,162 @@
+"""
+Multi-core search:
+- portfolio: several searches race in their own processes, the first solution wins
+- parallel_bfs: level synchronous bfs, every layer is expanded by a process pool
+
+Functions are handed to the processes by fork where it is available; with the
+spawn start method successors, goal tests and heuristics must be picklable
+(no lambdas or closures).
+"""
+from typing import TypeVar, List, Callable, Optional, Tuple, Dict, Any, Sequence
+from multiprocessing import Process, Queue, get_context
+from queue import Empty
+from time import perf_counter
+from os import cpu_count
+import random
+from c2_generic_search import dfs, bfs, astar, Node, node_to_path, _path_to_node
+from c2_maze_solution import Maze, MazeLocation, manhattan_distance, euclidean_distance
+
+T = TypeVar('T')
+Strategy = Tuple[str, Callable[..., Optional[Node]], Tuple[Any, ...]]
+WORKERS: int = cpu_count() or 1
+LOCAL_LAYER: int = 2048 # smaller layers are not worth sending to the pool
+
+def _context() -> Any:
+    try:
+        return get_context('fork')
+    except ValueError:
+        return get_context()
+
+def _run_strategy(name: str,
+                  search: Callable[..., Optional[Node]],
+                  args: Tuple[Any, ...],
+                  results: Queue) -> None:
+    try:
+        solution: Optional[Node] = search(*args)
+    except Exception:
+        # A failed strategy still reports, or the collector would wait for it forever
+        results.put((name, None))
+        raise
+    # A path, not the Node chain: pickling long parent chains recurses once per node
+    results.put((name, node_to_path(solution) if solution is not None else None))
+
+def portfolio(initial: T,
+              goal_test: Callable[[T], bool],
+              successors: Callable[[T], List[T]],
+              strategies: Sequence[Strategy],
+              timeout: Optional[float] = None) -> Optional[Tuple[str, List[T]]]:
+    # strategies: (name, search, extra args after initial, goal_test, successors)
+    context: Any = _context()
+    results: Queue = context.Queue()
+    processes: List[Process] = [
+        context.Process(target=_run_strategy,
+                        args=(name, search, (initial, goal_test, successors) + tuple(extra), results),
+                        daemon=True)
+        for name, search, extra in strategies]
+    for process in processes:
+        process.start()
+
+    deadline: Optional[float] = None if timeout is None else perf_counter() + timeout
+    try:
+        for _ in processes:
+            remaining: Optional[float] = None if deadline is None else max(0.0, deadline - perf_counter())
+            try:
+                name, path = results.get(timeout=remaining)
+            except Empty:
+                return None
+            if path is not None:
+                return name, path
+        return None
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+def default_strategies(heuristics: Dict[str, Callable[[T], float]]) -> List[Strategy]:
+    strategies: List[Strategy] = [('dfs', dfs, ()), ('bfs', bfs, ())]
+    for name, heuristic in heuristics.items():
+        strategies.append(('astar-' + name, astar, (heuristic, )))
+    return strategies
+
+# --------------- Level synchronous bfs ---------------
+_worker_successors: Optional[Callable[[Any], List[Any]]] = None
+_worker_goal_test: Optional[Callable[[Any], bool]] = None
+
+def _init_worker(successors: Callable[[T], List[T]], goal_test: Callable[[T], bool]) -> None:
+    global _worker_successors, _worker_goal_test
+    _worker_successors = successors
+    _worker_goal_test = goal_test
+
+def _expand_chunk(states: List[T]) -> Tuple[List[Tuple[T, T]], Optional[T]]:
+    # (child, parent) pairs, deduplicated inside the chunk, and a goal if one was generated
+    return _expand(states, _worker_successors, _worker_goal_test)
+
+def _expand(states: List[T],
+            successors: Callable[[T], List[T]],
+            goal_test: Callable[[T], bool]) -> Tuple[List[Tuple[T, T]], Optional[T]]:
+    seen: Dict[T, T] = {}
+    for state in states:
+        for child in successors(state):
+            if child not in seen:
+                seen[child] = state
+                if goal_test(child):
+                    return [(child, state)], child
+    return list(seen.items()), None
+
+def parallel_bfs(initial: T,
+                 goal_test: Callable[[T], bool],
+                 successors: Callable[[T], List[T]],
+                 workers: int = WORKERS) -> Optional[Node[T]]:
+    parents: Dict[T, Optional[T]] = {initial: None}
+    goal: Optional[T] = initial if goal_test(initial) else None
+    layer: List[T] = [initial]
+
+    with _context().Pool(workers, initializer=_init_worker, initargs=(successors, goal_test)) as pool:
+        while goal is None and layer:
+            if len(layer) < LOCAL_LAYER:
+                expanded = [_expand(layer, successors, goal_test)]
+            else:
+                size: int = -(-len(layer) // (workers * 4))
+                expanded = pool.map(_expand_chunk, [layer[i:i + size] for i in range(0, len(layer), size)])
+
+            next_layer: List[T] = []
+            for pairs, found in expanded:
+                for child, parent in pairs:
+                    if child not in parents:
+                        parents[child] = parent
+                        next_layer.append(child)
+                if found is not None and goal is None:
+                    goal = found
+            layer = next_layer
+
+    if goal is None:
+        return None
+
+    chain: List[T] = []
+    state: Optional[T] = goal
+    while state is not None:
+        chain.append(state)
+        state = parents[state]
+    chain.reverse()
+    return _path_to_node(chain)
+
+
+if __name__ == "__main__":
+    random.seed(11)
+    m: Maze = Maze(300, 300, 0.2, goal=MazeLocation(299, 299))
+
+    winner = portfolio(m.start, m.goal_test, m.successors,
+                       default_strategies({'manhattan': manhattan_distance(m.goal),
+                                           'euclidean': euclidean_distance(m.goal)}))
+    if winner is None:
+        print('No solution found by the portfolio')
+    else:
+        print('Portfolio winner: {} ({} steps)'.format(winner[0], len(winner[1])))
+
+    for name, search in (('bfs', lambda: bfs(m.start, m.goal_test, m.successors)),
+                         ('parallel_bfs', lambda: parallel_bfs(m.start, m.goal_test, m.successors))):
+        start: float = perf_counter()
+        solution: Optional[Node[MazeLocation]] = search()
+        print('{}: {:.3f}s, {} steps'.format(name, perf_counter() - start,
+                                             len(node_to_path(solution)) if solution else None))
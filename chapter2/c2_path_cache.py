@@ -0,0 +1,183 @@
+"""
+LRU cache of search results for repeated queries on the same Maze or Graph.
+Entries are keyed by (problem, problem.version, start, goal, algorithm,
+heuristic), so a mutation (which bumps version) makes every older entry
+unreachable; those age out of the LRU.
+
+Shortest paths (bfs, astar without a heuristic or with one declared
+admissible) from the same start are also merged into a parent tree: any
+part of a shortest path is itself a shortest path, so a query whose start
+is an ancestor of its goal in one of the trees is answered without searching.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from typing import TypeVar, Generic, List, Callable, Optional, Dict, Tuple, Hashable, Any
+from threading import RLock
+from time import perf_counter
+import random
+from chapter1.c1_memo import Memo, MISSING
+from c2_generic_search import dfs, bfs, astar, Node, node_to_path
+
+T = TypeVar('T')
+Key = Tuple[Any, int, Hashable, Hashable, str, Any]
+TreeKey = Tuple[Any, int, Hashable]
+
+# Searches with the generic (initial, goal_test, successors, ...) signature;
+# OPTIMAL ones return shortest paths, so they can be answered from the trees
+ALGORITHMS: Dict[str, Callable[..., Optional[Node]]] = {'dfs': dfs, 'bfs': bfs, 'astar': astar}
+OPTIMAL: Tuple[str, ...] = ('bfs', 'astar')
+
+
+class PathCache(Generic[T]):
+    def __init__(self, maxsize: Optional[int] = 1024, max_trees: Optional[int] = 64) -> None:
+        self._paths: Memo[Key, Optional[Tuple[T, ...]]] = Memo(maxsize)
+        self._trees: Memo[TreeKey, Dict[T, Optional[T]]] = Memo(max_trees)
+        # problem -> (version, roots of its trees); only the latest version is kept
+        self._roots: Dict[Any, Tuple[int, List[T]]] = {}
+        self._lock: RLock = RLock()
+        self.tree_hits: int = 0
+        self.searches: int = 0
+
+    def __repr__(self) -> str:
+        return 'PathCache(size={}, trees={}, hits={}, tree_hits={}, searches={}, hit_rate={:.2f})'\
+            .format(len(self._paths), len(self._trees), self._paths.hits, self.tree_hits,
+                    self.searches, self.hit_rate)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self._paths.hits + self._paths.misses
+        return (self._paths.hits + self.tree_hits) / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {'hits': self._paths.hits, 'tree_hits': self.tree_hits, 'searches': self.searches,
+                'evictions': self._paths.evictions, 'size': len(self._paths), 'trees': len(self._trees),
+                'hit_rate': self.hit_rate}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._paths.clear()
+            self._trees.clear()
+            self._roots.clear()
+            self.tree_hits = self.searches = 0
+
+    def search(self,
+               problem: Any,
+               start: T,
+               goal: T,
+               successors: Callable[[T], List[T]],
+               algorithm: str = 'bfs',
+               heuristic: Optional[Callable[[T], Callable[[T], float]]] = None,
+               admissible: bool = False) -> Optional[List[T]]:
+        # heuristic builds the astar heuristic for a goal, like manhattan_distance;
+        # astar paths only feed the trees without one or when it is admissible
+        version: int = getattr(problem, 'version', 0)
+        key: Key = (problem, version, start, goal, algorithm, heuristic)
+        with self._lock:
+            cached: Any = self._paths.get(key, MISSING)
+            if cached is not MISSING:
+                return None if cached is None else list(cached)
+
+            path: Optional[List[T]] = self._from_trees(problem, version, start, goal) \
+                if algorithm in OPTIMAL else None
+            if path is not None:
+                self.tree_hits += 1
+                self._paths[key] = tuple(path)
+                return path
+
+        # The search runs unlocked so hits are never queued behind a slow miss;
+        # two threads missing the same key both search and store equal results
+        path = self._search(start, goal, successors, algorithm, heuristic)
+        optimal: bool = algorithm == 'bfs' or (algorithm == 'astar' and (heuristic is None or admissible))
+        with self._lock:
+            self.searches += 1
+            # Skipped if the problem changed while searching
+            if path is not None and optimal and getattr(problem, 'version', 0) == version:
+                self._add_to_tree(problem, version, path)
+            self._paths[key] = None if path is None else tuple(path)
+        return path
+
+    @staticmethod
+    def _search(start: T,
+                goal: T,
+                successors: Callable[[T], List[T]],
+                algorithm: str,
+                heuristic: Optional[Callable[[T], Callable[[T], float]]]) -> Optional[List[T]]:
+        if algorithm not in ALGORITHMS:
+            raise ValueError('Unknown algorithm: {}'.format(algorithm))
+        extra: Tuple[Any, ...] = ()
+        if algorithm == 'astar':
+            extra = (heuristic(goal) if heuristic is not None else (lambda state: 0.0), )
+        solution: Optional[Node[T]] = ALGORITHMS[algorithm](start, lambda state: state == goal, successors, *extra)
+        return node_to_path(solution) if solution is not None else None
+
+    def _add_to_tree(self, problem: Any, version: int, path: List[T]) -> None:
+        root: T = path[0]
+        parents: Optional[Dict[T, Optional[T]]] = self._trees.get((problem, version, root))
+        if parents is None:
+            parents = {root: None}
+            self._trees[(problem, version, root)] = parents
+            if problem not in self._roots or self._roots[problem][0] != version:
+                # Trees of older versions are never read again and age out of the LRU
+                self._roots[problem] = (version, [])
+            self._roots[problem][1].append(root)
+        # Unit step costs: every stored parent is one step closer to the root,
+        # so mixing parents from different shortest paths keeps all chains shortest
+        for parent, child in zip(path, path[1:]):
+            parents.setdefault(child, parent)
+
+    def _from_trees(self, problem: Any, version: int, start: T, goal: T) -> Optional[List[T]]:
+        latest, roots = self._roots.get(problem, (version, []))
+        if latest != version:
+            del self._roots[problem]
+            return None
+        # The tree rooted at start first, then trees where start is an inner node
+        for root in sorted(roots, key=lambda root: root != start):
+            parents: Any = self._trees.get((problem, version, root), MISSING)
+            if parents is MISSING:
+                roots.remove(root) # evicted
+                if not roots:
+                    del self._roots[problem]
+                continue
+            if goal not in parents or start not in parents:
+                continue
+
+            chain: List[T] = []
+            state: Optional[T] = goal
+            while state is not None:
+                chain.append(state)
+                if state == start:
+                    chain.reverse()
+                    return chain
+                state = parents[state]
+
+        return None
+
+
+if __name__ == "__main__":
+    from c2_maze_solution import Maze, MazeLocation, manhattan_distance
+
+    random.seed(3)
+    m: Maze = Maze(60, 60, 0.2, goal=MazeLocation(59, 59))
+    cache: PathCache[MazeLocation] = PathCache(maxsize=256)
+    cells: List[MazeLocation] = [MazeLocation(random.randrange(60), random.randrange(60)) for _ in range(12)]
+    queries: List[Tuple[MazeLocation, MazeLocation]] = [(random.choice(cells), random.choice(cells))
+                                                        for _ in range(400)]
+
+    for name, run in (('astar', lambda s, g: astar(s, lambda ml: ml == g, m.successors, manhattan_distance(g))),
+                      ('cached astar', lambda s, g: cache.search(m, s, g, m.successors, 'astar',
+                                                                 manhattan_distance, admissible=True))):
+        begin: float = perf_counter()
+        for source, target in queries:
+            run(source, target)
+        print('{}: {:.3f}s'.format(name, perf_counter() - begin))
+    print(cache)
+
+    path: Optional[List[MazeLocation]] = cache.search(m, m.start, m.goal, m.successors)
+    if path is not None and len(path) > 2:
+        m.set_blocked(path[len(path) // 2])
+        rerouted: Optional[List[MazeLocation]] = cache.search(m, m.start, m.goal, m.successors)
+        print('After blocking {}: {} steps instead of {}'.format(
+            path[len(path) // 2], len(rerouted) if rerouted else None, len(path)))
@@ -1,12 +1,12 @@
 from __future__ import annotations
 import sys
-from typing import TypeVar, List, Optional, Tuple, Dict
+from typing import TypeVar, List, Optional, Tuple, Dict, Type, Union
 from dataclasses import dataclass
 from mst import WeightedPath, print_weighted_path
 from weighted_edge import WeightedEdge
 from weighted_graph import WeightedGraph
 sys.path.append([0, '..'])
-from chapter2.c2_generic_search import PriorityQueue
+from chapter2.c2_generic_search import PriorityQueue, IndexedPriorityQueue, RadixHeap
 
 
 V = TypeVar('V')
@@ -21,7 +21,13 @@ class DijkstraNode:
     def __eq__(self, other: DijkstraNode) -> bool:
         return self.distance == other.distance
 
-def dijsktra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+def dijsktra(wg: WeightedGraph[V],
+             root: V,
+             queue_type: Optional[Type[Union[IndexedPriorityQueue, RadixHeap]]] = None
+             ) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+    if queue_type is not None:
+        return _indexed_dijkstra(wg, root, queue_type)
+
     first: int = wg.index_of(root)
     distances: List[Optional[float]] = [None] * wg.vertex_count
     path_dict: Dict[int, WeightedEdge] = {}
@@ -43,6 +49,36 @@ def dijsktra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict
                 pq.push(DijkstraNode(we.vertex_to, we.weight + dist_vertex_from))
     return distances, path_dict
 
+def _indexed_dijkstra(wg: WeightedGraph[V],
+                      root: V,
+                      queue_type: Type[Union[IndexedPriorityQueue, RadixHeap]]
+                      ) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+    # One entry per vertex, improved in place (RadixHeap needs integer weights)
+    first: int = wg.index_of(root)
+    distances: List[Optional[float]] = [None] * wg.vertex_count
+    path_dict: Dict[int, WeightedEdge] = {}
+    pq = queue_type()
+    done: List[bool] = [False] * wg.vertex_count
+
+    distances[first] = 0
+    pq.push(first, 0)
+
+    while not pq.empty:
+        vertex_from, dist_vertex_from = pq.pop()
+        done[vertex_from] = True
+
+        for we in wg.edges_for_index(vertex_from):
+            if done[we.vertex_to]:
+                continue
+            dist_vertex_to: Optional[float] = distances[we.vertex_to]
+            new_distance: float = we.weight + dist_vertex_from
+
+            if dist_vertex_to is None or dist_vertex_to > new_distance:
+                distances[we.vertex_to] = new_distance
+                path_dict[we.vertex_to] = we
+                pq.push(we.vertex_to, new_distance)
+    return distances, path_dict
+
 def distance_array_to_vertex_dict(wg: WeightedGraph[V],
                                   distances: List[Optional[float]]) -> Dict[V, Optional[float]]:
     distance_dict: Dict[V, Optional[float]] = {}
@@ -108,4 +144,7 @@ if __name__ == "__main__":
     path: WeightedPath = path_dict_to_path(city_graph2.index_of('Los Angeles'), 
                                            city_graph2.index_of('Boston'),
                                            path_dict)
-    print_weighted_path(city_graph2, path)
\ No newline at end of file
+    print_weighted_path(city_graph2, path)
+
+    for queue_type in (IndexedPriorityQueue, RadixHeap):
+        print(f'{queue_type.__name__}: {dijsktra(city_graph2, "Los Angeles", queue_type)[0] == distances}')
\ No newline at end of file
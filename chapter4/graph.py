@@ -11,6 +11,7 @@ class Graph(Generic[V]):
     def __init__(self, vertices: List[V] = []) -> None:
         self._vertices: List[V] = vertices
         self._edges: List[List[Edge]] = [[] for _ in vertices]
+        self.version: int = 0 # bumped by every mutation
 
     @property
     def vertex_count(self) -> int:
@@ -23,11 +24,13 @@ class Graph(Generic[V]):
     def add_vertex(self, vertex: V) -> int:
         self._vertices.append(vertex)
         self._edges.append([])
+        self.version += 1
         return self.vertex_count - 1
     
     def add_edge(self, edge: Edge) -> None:
         self._edges[edge.vertex_from].append(edge)
         self._edges[edge.vertex_to].append(edge.reversed())
+        self.version += 1
     
     def add_edge_by_indices(self, _from: int, _to: int) -> None:
         edge: Edge = Edge(_from, _to)
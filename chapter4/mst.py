@@ -1,10 +1,10 @@
 import sys
 sys.path.append([0, '..'])
 
-from typing import TypeVar, List, Optional
+from typing import TypeVar, List, Optional, Dict
 from weighted_edge import WeightedEdge
 from weighted_graph import WeightedGraph
-from chapter2.c2_generic_search import PriorityQueue
+from chapter2.c2_generic_search import PriorityQueue, IndexedPriorityQueue
 
 V = TypeVar('V')
 WeightedPath = List[WeightedEdge]
@@ -12,9 +12,11 @@ WeightedPath = List[WeightedEdge]
 def total_weight(wp: WeightedPath) -> float:
     return sum([e.weight for e in wp])
 
-def mst(wg: WeightedGraph[V], start: int = 0) -> Optional[WeightedPath]:
+def mst(wg: WeightedGraph[V], start: int = 0, indexed: bool = False) -> Optional[WeightedPath]:
     if start > (wg.vertex_count - 1) or start < 0:
         return None
+    if indexed:
+        return _indexed_mst(wg, start)
     
     result: WeightedPath = []
     pq: PriorityQueue[WeightedEdge] = PriorityQueue()
@@ -37,6 +39,29 @@ def mst(wg: WeightedGraph[V], start: int = 0) -> Optional[WeightedPath]:
         visit(edge.vertex_to)
     return result
 
+def _indexed_mst(wg: WeightedGraph[V], start: int) -> WeightedPath:
+    # Eager Prim: one entry per vertex, keyed by the lightest edge reaching it
+    result: WeightedPath = []
+    pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+    best_edge: Dict[int, WeightedEdge] = {}
+    visited: List[bool] = [False] * wg.vertex_count
+
+    def visit(index: int) -> None:
+        visited[index] = True
+        for edge in wg.edges_for_index(index):
+            if visited[edge.vertex_to]:
+                continue
+            if edge.vertex_to not in pq or edge.weight < pq.priority(edge.vertex_to):
+                best_edge[edge.vertex_to] = edge
+                pq.push(edge.vertex_to, edge.weight)
+
+    visit(start)
+    while not pq.empty:
+        vertex: int = pq.pop()[0]
+        result.append(best_edge[vertex])
+        visit(vertex)
+    return result
+
 def print_weighted_path(wg: WeightedGraph, wp: WeightedPath) -> None:
     for edge in wp:
         print(f'{wg.vertex_at(edge.vertex_from)} {edge.weight} -> {wg.vertex_at(edge.vertex_to)}')
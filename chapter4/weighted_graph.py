@@ -9,6 +9,7 @@ class WeightedGraph(Generic[V], Graph[V]):
     def __init__(self, vertices: List[V] = []) -> None:
         self._vertices: List[V] = vertices
         self._edges: List[List[WeightedEdge]] = [[] for _ in vertices]
+        self.version: int = 0
     
     def add_edge_by_indices(self, _from: int, _to: int, weight: float) -> None:
         edge: WeightedEdge = WeightedEdge(_from, _to, weight)